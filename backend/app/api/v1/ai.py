@@ -155,8 +155,8 @@ async def get_solar_term_insight(
         "astronomy": term_info.astronomy,
         "agriculture": term_info.agriculture,
         "weather": term_info.weather,
-        "phenology": term_info.phenology,
-        "proverbs": term_info.proverbs,
+        "phenology": list(term_info.phenology),
+        "proverbs": list(term_info.proverbs),
         "health_tips": term_info.health_tips,
     }
 
@@ -227,7 +227,7 @@ async def get_proverb_insight(
         "category": proverb.category.value,
         "region": proverb.region.value,
         "related_solar_term": proverb.related_solar_term,
-        "applicable_months": proverb.applicable_months,
+        "applicable_months": list(proverb.applicable_months),
         "scientific_explanation": proverb.scientific_explanation,
     }
 
@@ -4,6 +4,7 @@
 用於 Cloud Scheduler 觸發的每日 LINE 報告。
 """
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from fastapi import APIRouter, Depends, Query
 
@@ -16,7 +17,7 @@ from app.schemas.weather import ApiResponse
 from app.services.notification import send_line_message
 from app.services.realtime_weather import fetch_realtime_weather
 from app.services.lunar import get_lunar_info
-from app.services.solar_term import get_current_solar_term
+from app.services.solar_term import get_current_solar_term_async
 from app.models import DailyStatistics
 from app.services.decade_stats import get_extreme_records
 
@@ -28,8 +29,11 @@ async def generate_daily_report(station_id: str, db: Session) -> str:
     today = datetime.now(TW_TIMEZONE)
     month_day = today.strftime("%m-%d")
 
-    # 取得即時天氣
-    realtime = await fetch_realtime_weather(station_id)
+    # 取得即時天氣與節氣（節氣計算在執行緒中與 API 請求並行）
+    realtime, solar_term = await asyncio.gather(
+        fetch_realtime_weather(station_id),
+        get_current_solar_term_async(today.date()),
+    )
 
     # 取得歷史統計
     stats = db.query(DailyStatistics).filter(
@@ -41,9 +45,6 @@ async def generate_daily_report(station_id: str, db: Session) -> str:
     lunar_info = get_lunar_info(today.date())
     lunar_date = lunar_info.get("lunar_date", {})
 
-    # 取得節氣
-    solar_term = get_current_solar_term(today.date())
-
     # 取得極值
     extreme_records = get_extreme_records(db, station_id, month_day)
 
@@ -91,8 +91,8 @@ def _convert_proverb_to_response(proverb: Proverb) -> ProverbResponse:
         region=proverb.region.value,
         related_solar_term=proverb.related_solar_term,
         scientific_explanation=proverb.scientific_explanation,
-        applicable_months=proverb.applicable_months,
-        keywords=proverb.keywords,
+        applicable_months=list(proverb.applicable_months),
+        keywords=list(proverb.keywords),
         verifiable=proverb.verifiable,
     )
 
@@ -63,8 +63,8 @@ def _convert_to_response(info: SolarTermInfo) -> SolarTermResponse:
         astronomy=info.astronomy,
         agriculture=info.agriculture,
         weather=info.weather,
-        phenology=info.phenology,
-        proverbs=info.proverbs,
+        phenology=list(info.phenology),
+        proverbs=list(info.proverbs),
         health_tips=info.health_tips,
     )
 
@@ -9,6 +9,7 @@ import click
 
 from app.database import SessionLocal, init_db
 from app.services.cwa_sync import CWASyncService
+from app.services.monthly_stats import refresh_monthly_statistics
 
 
 @click.group()
@@ -43,5 +44,20 @@ def init_database():
     click.echo("資料庫初始化完成！")
 
 
+@cli.command()
+@click.option("--station-id", default=None, help="只重算指定站點")
+def compute_monthly_stats(station_id):
+    """從觀測資料重算每月統計快照"""
+    click.echo("正在計算每月統計...")
+
+    # 確保資料表存在
+    init_db()
+
+    with SessionLocal() as db:
+        count = refresh_monthly_statistics(db, station_id)
+
+    click.echo(f"計算完成！共寫入 {count} 筆每月統計")
+
+
 if __name__ == "__main__":
     cli()
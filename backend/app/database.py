@@ -1,12 +1,13 @@
 # backend/app/database.py
 """資料庫連線管理"""
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.schema import CreateColumn
 from typing import Generator
 
 from app.config import settings
-from app.models import Base
+from app.models import Base, RawObservation
 
 
 engine = create_engine(
@@ -17,9 +18,32 @@ engine = create_engine(
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
-def init_db():
+def _add_generated_date_columns(bind: Engine) -> None:
+    """為既有的 raw_observations 補上 observed_year/month/day 產生欄位與索引
+
+    create_all 不會修改已存在的資料表，舊資料庫需在此補欄位。
+    """
+    table = RawObservation.__table__
+    existing = {col["name"] for col in inspect(bind).get_columns(table.name)}
+    missing = [
+        col for col in (table.c.observed_year, table.c.observed_month, table.c.observed_day)
+        if col.name not in existing
+    ]
+    if not missing:
+        return
+
+    with bind.begin() as conn:
+        for col in missing:
+            ddl = CreateColumn(col).compile(dialect=bind.dialect)
+            conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {ddl}"))
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
+def init_db(bind: Engine = engine):
     """初始化資料庫表"""
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=bind)
+    _add_generated_date_columns(bind)
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -0,0 +1,38 @@
+"""日誌設定模組
+
+應用程式日誌先由 QueueHandler 放入佇列，再由背景執行緒的 QueueListener 寫出，
+非同步路由中記錄日誌時不會因 stdout 阻塞而卡住事件迴圈。
+"""
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+
+def setup_logging(level: int = logging.INFO) -> QueueListener:
+    """設定 app.* 日誌經由佇列輸出
+
+    Args:
+        level: 日誌等級
+
+    Returns:
+        已啟動的 QueueListener，應用程式關閉時需呼叫 stop() 寫出剩餘日誌
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    logger = logging.getLogger("app")
+    logger.setLevel(level)
+    # 重複呼叫（如開發模式重新載入）時不重複加入 handler
+    for handler in [h for h in logger.handlers if isinstance(h, QueueHandler)]:
+        logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.propagate = False
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
@@ -1,20 +1,35 @@
 # backend/app/main.py
 """FastAPI 應用程式入口"""
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.database import init_db
+from app.logging_config import setup_logging
+from app.services.realtime_weather import close_client
+from app.services.solar_term import warm_up_solar_terms
 from app.api.v1 import weather, stations, lunar, solar_term, proverb, ai, planner, daily_report, line_webhook, day_insight
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup / shutdown lifecycle (replaces deprecated on_event)."""
+    log_listener = setup_logging()
     init_db()
-    yield
+    # 在背景執行緒建立節氣表，不延遲啟動，也不由第一個請求負擔
+    warm_up = asyncio.create_task(asyncio.to_thread(warm_up_solar_terms))
+    try:
+        yield
+    finally:
+        # 預熱失敗時仍須關閉共用 client 與日誌執行緒
+        try:
+            await warm_up
+        finally:
+            await close_client()
+            log_listener.stop()
 
 
 app = FastAPI(
@@ -13,7 +13,15 @@ class Base(DeclarativeBase):
 
 # 匯出所有模型
 from app.models.observation import RawObservation
-from app.models.statistics import DailyStatistics
+from app.models.statistics import DailyStatistics, MonthlyStatistics
 from app.models.station import Station
+from app.models.verification import ProverbVerificationCache
 
-__all__ = ["Base", "RawObservation", "DailyStatistics", "Station"]
+__all__ = [
+    "Base",
+    "RawObservation",
+    "DailyStatistics",
+    "MonthlyStatistics",
+    "Station",
+    "ProverbVerificationCache",
+]
@@ -6,7 +6,18 @@
 from datetime import date
 from typing import Optional
 
-from sqlalchemy import Date, Float, Integer, String, UniqueConstraint
+from sqlalchemy import (
+    Computed,
+    Date,
+    Float,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    UniqueConstraint,
+    column,
+    extract,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models import Base
@@ -22,6 +33,7 @@ class RawObservation(Base):
         id: 主鍵
         station_id: 氣象站代碼（如 466920 為台北站）
         observed_date: 觀測日期
+        observed_year / observed_month / observed_day: 由觀測日期產生的年、月、日欄位
         temperature_avg: 日平均溫度 (°C)
         temperature_max: 日最高溫度 (°C)
         temperature_min: 日最低溫度 (°C)
@@ -36,15 +48,29 @@ class RawObservation(Base):
 
     __tablename__ = "raw_observations"
 
-    # 使用複合唯一約束防止同一站點同一天有重複資料
+    # 使用複合唯一約束防止同一站點同一天有重複資料；
+    # 其 (station_id, observed_date) 索引同時供依站點 + 日期範圍的查詢使用
     __table_args__ = (
         UniqueConstraint("station_id", "observed_date", name="uq_station_date"),
+        # 依站點 + 月份篩選（如特定月份統計）可直接使用索引
+        Index("ix_station_month", "station_id", "observed_month"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     station_id: Mapped[str] = mapped_column(String(10), nullable=False, index=True)
     observed_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
 
+    # 由觀測日期產生的欄位（資料庫自動計算，不需寫入）
+    observed_year: Mapped[Optional[int]] = mapped_column(
+        SmallInteger, Computed(extract("year", column("observed_date"))), nullable=True
+    )
+    observed_month: Mapped[Optional[int]] = mapped_column(
+        SmallInteger, Computed(extract("month", column("observed_date"))), nullable=True
+    )
+    observed_day: Mapped[Optional[int]] = mapped_column(
+        SmallInteger, Computed(extract("day", column("observed_date"))), nullable=True
+    )
+
     # 溫度相關欄位
     temperature_avg: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     temperature_max: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
@@ -1,7 +1,8 @@
 """統計快照資料模型
 
-儲存預計算的每日統計資料，用於快速查詢歷史天氣模式。
-每個站點的每一天（MM-DD）都有一筆統計記錄。
+儲存預計算的統計資料，用於快速查詢歷史天氣模式。
+- DailyStatistics：每個站點的每一天（MM-DD）一筆
+- MonthlyStatistics：每個站點的每個月份一筆
 """
 
 from datetime import datetime
@@ -108,3 +109,62 @@ class DailyStatistics(Base):
             f"month_day={self.month_day!r}, "
             f"temp_avg_mean={self.temp_avg_mean})"
         )
+
+
+class MonthlyStatistics(Base):
+    """每月統計快照表
+
+    彙總各站點歷年同一月份的溫度統計，供諺語驗證等
+    只需要月份層級數據的查詢使用，避免每次掃描完整觀測歷史。
+    由 `refresh_monthly_statistics` 於匯入觀測資料後重算。
+
+    Attributes:
+        id: 主鍵
+        station_id: 氣象站代碼
+        month: 月份 (1-12)
+
+        # 最高溫統計
+        temp_max_count: 有最高溫紀錄的天數
+        temp_max_mean: 最高溫的平均值 (°C)
+        hot_days_35: 最高溫 >= 35°C 的天數
+
+        # 最低溫統計
+        temp_min_count: 有最低溫紀錄的天數
+        temp_min_mean: 最低溫的平均值 (°C)
+        cold_days_10: 最低溫 < 10°C 的天數
+
+        # 元數據
+        computed_at: 統計計算時間
+    """
+
+    __tablename__ = "monthly_statistics"
+
+    __table_args__ = (
+        UniqueConstraint("station_id", "month", name="uq_station_month"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    station_id: Mapped[str] = mapped_column(String(10), nullable=False, index=True)
+    month: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # 最高溫統計
+    temp_max_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    temp_max_mean: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    hot_days_35: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # 最低溫統計
+    temp_min_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    temp_min_mean: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    cold_days_10: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # 元數據
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"MonthlyStatistics(station_id={self.station_id!r}, "
+            f"month={self.month}, "
+            f"temp_max_mean={self.temp_max_mean})"
+        )
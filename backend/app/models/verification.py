@@ -0,0 +1,50 @@
+"""諺語驗證結果快取模型
+
+儲存各站點最近一次的諺語驗證結果，供統計摘要直接彙總。
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.models import Base
+
+
+class ProverbVerificationCache(Base):
+    """諺語驗證結果快取表
+
+    `verify_all_proverbs` 重新驗證後以 upsert 更新該站點的結果，
+    `get_proverb_stats_summary` 直接在此表彙總，不必重新驗證。
+
+    Attributes:
+        id: 主鍵
+        proverb_id: 諺語 ID
+        station_id: 氣象站代碼
+        accuracy: 準確率 (0-1)
+        total_cases: 樣本數
+        computed_at: 驗證時間
+    """
+
+    __tablename__ = "proverb_verification_cache"
+
+    __table_args__ = (
+        UniqueConstraint("station_id", "proverb_id", name="uq_station_proverb"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    proverb_id: Mapped[str] = mapped_column(String(50), nullable=False)
+    station_id: Mapped[str] = mapped_column(String(10), nullable=False, index=True)
+    accuracy: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    total_cases: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"ProverbVerificationCache(station_id={self.station_id!r}, "
+            f"proverb_id={self.proverb_id!r}, "
+            f"accuracy={self.accuracy})"
+        )
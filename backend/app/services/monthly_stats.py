@@ -0,0 +1,61 @@
+"""每月統計快照服務
+
+從 raw_observations 彙總各站點各月份的溫度統計，
+寫入 monthly_statistics 表供諺語驗證等查詢使用。
+"""
+
+from typing import Optional
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from app.models import MonthlyStatistics, RawObservation
+
+
+def refresh_monthly_statistics(db: Session, station_id: Optional[str] = None) -> int:
+    """重算每月統計快照
+
+    Args:
+        db: 資料庫 session
+        station_id: 只重算指定站點（可選，預設全部站點）
+
+    Returns:
+        寫入的統計筆數
+    """
+    temp_max = RawObservation.temperature_max
+    temp_min = RawObservation.temperature_min
+    month = RawObservation.observed_month
+
+    query = db.query(
+        RawObservation.station_id,
+        month.label('month'),
+        func.count(temp_max).label('temp_max_count'),
+        func.avg(temp_max).label('temp_max_mean'),
+        func.sum(case((temp_max >= 35, 1), else_=0)).label('hot_days_35'),
+        func.count(temp_min).label('temp_min_count'),
+        func.avg(temp_min).label('temp_min_mean'),
+        func.sum(case((temp_min < 10, 1), else_=0)).label('cold_days_10'),
+    )
+    delete_query = db.query(MonthlyStatistics)
+    if station_id:
+        query = query.filter(RawObservation.station_id == station_id)
+        delete_query = delete_query.filter(MonthlyStatistics.station_id == station_id)
+
+    rows = query.group_by(RawObservation.station_id, month).all()
+
+    delete_query.delete(synchronize_session=False)
+    db.add_all(
+        MonthlyStatistics(
+            station_id=row.station_id,
+            month=int(row.month),
+            temp_max_count=row.temp_max_count,
+            temp_max_mean=row.temp_max_mean,
+            hot_days_35=row.hot_days_35 or 0,
+            temp_min_count=row.temp_min_count,
+            temp_min_mean=row.temp_min_mean,
+            cold_days_10=row.cold_days_10 or 0,
+        )
+        for row in rows
+    )
+    db.commit()
+    return len(rows)
@@ -4,11 +4,15 @@
 根據歷史天氣、節氣、農民曆推薦最佳活動日期。
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import date, timedelta
-from typing import Optional
+from types import MappingProxyType
+import threading
+from typing import NamedTuple, Optional
 from enum import Enum
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.models import DailyStatistics, Station
@@ -169,6 +173,38 @@ ACTIVITY_PREFERENCES = {
 }
 
 
+# 農民曆「宜」對應活動的關鍵字
+_YI_KEYWORDS = MappingProxyType({
+    ActivityType.WEDDING: ("嫁娶", "訂盟", "納采"),
+    ActivityType.OUTDOOR_WEDDING: ("嫁娶", "訂盟"),
+    ActivityType.HIKING: ("出行", "遠行", "登山"),
+    ActivityType.CAMPING: ("出行", "遠行"),
+    ActivityType.GENERAL_OUTDOOR: ("出行",),
+})
+
+# 農民曆「忌」對應活動的關鍵字
+_JI_KEYWORDS = MappingProxyType({
+    ActivityType.WEDDING: ("嫁娶",),
+    ActivityType.OUTDOOR_WEDDING: ("嫁娶",),
+    ActivityType.HIKING: ("出行", "遠行"),
+    ActivityType.CAMPING: ("出行", "遠行"),
+})
+
+
+class _DayStats(NamedTuple):
+    """評分用的每日統計欄位（取自 DailyStatistics）"""
+    month_day: str
+    precip_probability: Optional[float]
+    temp_avg_mean: Optional[float]
+    tendency_sunny: Optional[float]
+
+
+# 各站點每日統計快取（station_id → (資料版本, {month_day: 評分欄位})），最多保留 64 站
+_STATION_STATS_CACHE: OrderedDict[str, tuple[tuple, dict[str, _DayStats]]] = OrderedDict()
+_STATION_STATS_CACHE_SIZE = 64
+_station_stats_lock = threading.Lock()
+
+
 @dataclass
 class DayScore:
     """單日評分"""
@@ -198,12 +234,67 @@ class PlannerResult:
     summary: str
 
 
+def _station_stats_version(db: Session, station_id: str) -> tuple:
+    """站點每日統計的資料版本（最大 id, 最新計算時間）
+
+    資料管線重算時會刪除後重新寫入，兩者皆會改變；
+    以 station_id 索引定位，每次只讀取該站點約 366 列的索引。
+    """
+    is_station = DailyStatistics.station_id == station_id
+    return tuple(db.execute(select(
+        select(func.max(DailyStatistics.id)).where(is_station).scalar_subquery(),
+        select(func.max(DailyStatistics.computed_at)).where(is_station).scalar_subquery(),
+    )).one())
+
+
+def _get_station_stats(db: Session, station_id: str) -> dict[str, _DayStats]:
+    """取得站點全年每日統計（僅評分用欄位），並快取於程序內
+
+    DailyStatistics 由另一個程序（資料管線）重算，因此快取以資料版本
+    驗證，版本改變即重新讀取。
+
+    Returns:
+        {month_day: _DayStats}
+    """
+    version = _station_stats_version(db, station_id)
+    with _station_stats_lock:
+        cached = _STATION_STATS_CACHE.get(station_id)
+        if cached is not None and cached[0] == version:
+            _STATION_STATS_CACHE.move_to_end(station_id)
+            return cached[1]
+
+    rows = db.query(
+        DailyStatistics.month_day,
+        DailyStatistics.precip_probability,
+        DailyStatistics.temp_avg_mean,
+        DailyStatistics.tendency_sunny,
+    ).filter(DailyStatistics.station_id == station_id).all()
+    stats = {row.month_day: _DayStats(*row) for row in rows}
+
+    with _station_stats_lock:
+        _STATION_STATS_CACHE[station_id] = (version, stats)
+        _STATION_STATS_CACHE.move_to_end(station_id)
+        if len(_STATION_STATS_CACHE) > _STATION_STATS_CACHE_SIZE:
+            _STATION_STATS_CACHE.popitem(last=False)
+    return stats
+
+
+def clear_station_stats_cache() -> None:
+    """清除站點統計快取（同一程序內重算統計資料後呼叫）"""
+    with _station_stats_lock:
+        _STATION_STATS_CACHE.clear()
+
+
 def _calculate_weather_score(
-    stats: DailyStatistics,
+    stats: _DayStats,
     prefs: dict,
 ) -> tuple[float, list[str]]:
     """計算天氣分數
 
+    Args:
+        stats: 當日的評分用統計欄位
+        prefs: 活動偏好設定
+
     Returns:
         (分數 0-100, 備註列表)
     """
@@ -253,52 +344,38 @@ def _calculate_weather_score(
     return max(0, min(100, score)), notes
 
 
-def _get_lunar_score_notes(lunar_info: dict, activity_type: ActivityType) -> tuple[float, list[str]]:
+def _get_lunar_score_notes(
+    lunar_info: dict,
+    yi_keywords: tuple[str, ...],
+    ji_keywords: tuple[str, ...],
+) -> tuple[float, list[str]]:
     """根據農民曆宜忌計算分數和備註
 
     Args:
         lunar_info: 農曆資訊 dict，包含 yi_ji 等欄位
-        activity_type: 活動類型
+        yi_keywords: 此活動在「宜」中要找的關鍵字
+        ji_keywords: 此活動在「忌」中要找的關鍵字
     """
     notes = []
     score_adj = 0
 
-    # 檢查宜
-    yi_keywords = {
-        ActivityType.WEDDING: ["嫁娶", "訂盟", "納采"],
-        ActivityType.OUTDOOR_WEDDING: ["嫁娶", "訂盟"],
-        ActivityType.HIKING: ["出行", "遠行", "登山"],
-        ActivityType.CAMPING: ["出行", "遠行"],
-        ActivityType.GENERAL_OUTDOOR: ["出行"],
-    }
-
-    # 檢查忌
-    ji_keywords = {
-        ActivityType.WEDDING: ["嫁娶"],
-        ActivityType.OUTDOOR_WEDDING: ["嫁娶"],
-        ActivityType.HIKING: ["出行", "遠行"],
-        ActivityType.CAMPING: ["出行", "遠行"],
-    }
-
     yi_ji = lunar_info.get("yi_ji", {})
     yi_list = yi_ji.get("yi", [])
     ji_list = yi_ji.get("ji", [])
 
     # 檢查宜
-    if activity_type in yi_keywords:
-        for kw in yi_keywords[activity_type]:
-            if any(kw in yi for yi in yi_list):
-                score_adj += 5
-                notes.append(f"宜{kw}")
-                break
+    for kw in yi_keywords:
+        if any(kw in yi for yi in yi_list):
+            score_adj += 5
+            notes.append(f"宜{kw}")
+            break
 
     # 檢查忌
-    if activity_type in ji_keywords:
-        for kw in ji_keywords[activity_type]:
-            if any(kw in ji for ji in ji_list):
-                score_adj -= 10
-                notes.append(f"忌{kw}")
-                break
+    for kw in ji_keywords:
+        if any(kw in ji for ji in ji_list):
+            score_adj -= 10
+            notes.append(f"忌{kw}")
+            break
 
     return score_adj, notes
 
@@ -331,30 +408,31 @@ def plan_activity(
 
     # 取得活動偏好
     prefs = ACTIVITY_PREFERENCES.get(activity_type, ACTIVITY_PREFERENCES[ActivityType.GENERAL_OUTDOOR])
+    yi_keywords = _YI_KEYWORDS.get(activity_type, ())
+    ji_keywords = _JI_KEYWORDS.get(activity_type, ())
+
+    stats_by_day = _get_station_stats(db, station_id)
 
     # 計算每日分數
     day_scores: list[DayScore] = []
+    one_day = timedelta(days=1)
 
     current = start_date
     while current <= end_date:
-        month_day = current.strftime("%m-%d")
-
-        # 取得歷史統計
-        stats = db.query(DailyStatistics).filter(
-            DailyStatistics.station_id == station_id,
-            DailyStatistics.month_day == month_day
-        ).first()
+        stats = stats_by_day.get(current.strftime("%m-%d"))
 
         if not stats:
-            current += timedelta(days=1)
+            current += one_day
             continue
 
+        _, precip_probability, temp_avg_mean, tendency_sunny = stats
+
         # 計算天氣分數
         weather_score, weather_notes = _calculate_weather_score(stats, prefs)
 
         # 取得農曆資訊
         lunar_info = get_lunar_info(current)
-        lunar_adj, lunar_notes = _get_lunar_score_notes(lunar_info, activity_type)
+        lunar_adj, lunar_notes = _get_lunar_score_notes(lunar_info, yi_keywords, ji_keywords)
 
         # 取得節氣
         solar_term = get_current_solar_term(current)
@@ -375,9 +453,9 @@ def plan_activity(
             date=current,
             score=max(0, min(100, total_score)),
             weather_score=weather_score,
-            rain_probability=stats.precip_probability or 0,
-            temp_avg=stats.temp_avg_mean or 25,
-            sunny_ratio=stats.tendency_sunny or 0,
+            rain_probability=precip_probability or 0,
+            temp_avg=temp_avg_mean or 25,
+            sunny_ratio=tendency_sunny or 0,
             solar_term=solar_term,
             lunar_date=f"{lunar_month}{lunar_day}",
             lunar_yi=yi_ji.get("yi", [])[:3],
@@ -385,7 +463,7 @@ def plan_activity(
             notes=weather_notes + lunar_notes + solar_notes,
         ))
 
-        current += timedelta(days=1)
+        current += one_day
 
     if not day_scores:
         return None
@@ -431,25 +509,25 @@ def _generate_summary(
     else:
         quality = "條件較差"
 
-    summary = f"在{station_name}地區，{best.date.strftime('%m/%d')} {quality}{activity_type.value}。"
+    parts = [f"在{station_name}地區，{best.date.strftime('%m/%d')} {quality}{activity_type.value}。"]
 
     if best.rain_probability < 0.2:
-        summary += f"降雨機率低（{best.rain_probability*100:.0f}%）。"
+        parts.append(f"降雨機率低（{best.rain_probability*100:.0f}%）。")
     elif best.rain_probability < 0.4:
-        summary += f"有些許降雨可能（{best.rain_probability*100:.0f}%）。"
+        parts.append(f"有些許降雨可能（{best.rain_probability*100:.0f}%）。")
     else:
-        summary += f"需注意降雨（{best.rain_probability*100:.0f}%）。"
+        parts.append(f"需注意降雨（{best.rain_probability*100:.0f}%）。")
 
-    summary += f"歷史平均溫度 {best.temp_avg:.1f}°C。"
+    parts.append(f"歷史平均溫度 {best.temp_avg:.1f}°C。")
 
     if best.solar_term:
-        summary += f"當天為{best.solar_term}。"
+        parts.append(f"當天為{best.solar_term}。")
 
     if len(recommendations) > 1:
         alternatives = [r.date.strftime('%m/%d') for r in recommendations[1:3]]
-        summary += f"備選日期：{', '.join(alternatives)}。"
+        parts.append(f"備選日期：{', '.join(alternatives)}。")
 
-    return summary
+    return "".join(parts)
 
 
 def get_activity_types() -> list[dict]:
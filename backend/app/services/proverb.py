@@ -7,7 +7,7 @@
 - 諺語科學解釋
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import date, timedelta
 from typing import Optional, Callable
 from enum import Enum
@@ -37,7 +37,7 @@ class ProverbRegion(str, Enum):
     HOKKIEN = "閩南"         # 閩南語諺語
 
 
-@dataclass
+@dataclass(slots=True)
 class ProverbVerification:
     """諺語驗證結果"""
     total_cases: int          # 總驗證樣本數
@@ -48,7 +48,7 @@ class ProverbVerification:
     methodology: str          # 驗證方法說明
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Proverb:
     """諺語資料"""
     id: str                              # 諺語 ID
@@ -59,8 +59,8 @@ class Proverb:
     region: ProverbRegion = ProverbRegion.TAIWAN
     related_solar_term: Optional[str] = None  # 相關節氣
     scientific_explanation: str = ""     # 科學解釋
-    applicable_months: list[int] = field(default_factory=list)  # 適用月份
-    keywords: list[str] = field(default_factory=list)  # 關鍵字
+    applicable_months: tuple[int, ...] = ()  # 適用月份
+    keywords: tuple[str, ...] = ()           # 關鍵字
     verifiable: bool = True              # 是否可用數據驗證
     verification_method: str = ""        # 驗證方法描述
 
@@ -79,8 +79,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         region=ProverbRegion.TAIWAN,
         related_solar_term="立春",
         scientific_explanation="立春前後臺灣處於東北季風尾聲與春雨過渡期，若形成持續性鋒面，確實可能延續多日降雨。",
-        applicable_months=[2, 3, 4],
-        keywords=["立春", "清明", "降雨"],
+        applicable_months=(2, 3, 4),
+        keywords=("立春", "清明", "降雨"),
         verification_method="檢查立春日有雨的年份中，立春至清明期間的降雨天數是否高於平均",
     ),
     "qingming_rain": Proverb(
@@ -91,8 +91,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         region=ProverbRegion.CHINA,
         related_solar_term="清明",
         scientific_explanation="清明前後臺灣進入梅雨季前期，華南雲雨帶北移，降雨機率確實較高。",
-        applicable_months=[4],
-        keywords=["清明", "降雨"],
+        applicable_months=(4,),
+        keywords=("清明", "降雨"),
         verification_method="計算清明節前後一週的歷史降雨機率",
     ),
     "xiazhi_heat": Proverb(
@@ -103,8 +103,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         region=ProverbRegion.CHINA,
         related_solar_term="夏至",
         scientific_explanation="夏至是北半球白晝最長的一天，但地表熱量累積需要時間，最熱時期通常在夏至後一個月左右。",
-        applicable_months=[6, 7],
-        keywords=["夏至", "溫度", "炎熱"],
+        applicable_months=(6, 7),
+        keywords=("夏至", "溫度", "炎熱"),
         verification_method="比較夏至前後各 30 天的平均最高溫",
     ),
     "dongzhi_cold": Proverb(
@@ -115,8 +115,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         region=ProverbRegion.CHINA,
         related_solar_term="冬至",
         scientific_explanation="冬至是北半球白晝最短的一天，但地表冷卻需要時間，最冷時期通常在冬至後的小寒、大寒。",
-        applicable_months=[12, 1],
-        keywords=["冬至", "溫度", "寒冷"],
+        applicable_months=(12, 1),
+        keywords=("冬至", "溫度", "寒冷"),
         verification_method="比較冬至前後各 30 天的平均最低溫",
     ),
     "bailu_dew": Proverb(
@@ -127,8 +127,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         region=ProverbRegion.CHINA,
         related_solar_term="白露",
         scientific_explanation="白露時節臺灣受東北季風影響，氣溫明顯下降，日夜溫差加大。",
-        applicable_months=[9],
-        keywords=["白露", "溫度", "轉涼"],
+        applicable_months=(9,),
+        keywords=("白露", "溫度", "轉涼"),
         verification_method="計算白露前後平均溫度變化幅度",
     ),
 
@@ -141,8 +141,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         category=ProverbCategory.SEASONAL,
         region=ProverbRegion.HOKKIEN,
         scientific_explanation="春季為季風交替期，冷暖氣團交替頻繁，加上鋒面通過，天氣確實多變。",
-        applicable_months=[3, 4, 5],
-        keywords=["春天", "天氣變化"],
+        applicable_months=(3, 4, 5),
+        keywords=("春天", "天氣變化"),
         verification_method="計算春季每日溫差變化的標準差",
     ),
     "june_fire_burning": Proverb(
@@ -153,8 +153,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         category=ProverbCategory.TEMPERATURE,
         region=ProverbRegion.HOKKIEN,
         scientific_explanation="農曆六月（約國曆七月）正值臺灣盛夏，太平洋高壓籠罩，常出現高溫。",
-        applicable_months=[7],
-        keywords=["六月", "高溫", "炎熱"],
+        applicable_months=(7,),
+        keywords=("六月", "高溫", "炎熱"),
         verification_method="計算七月超過 35°C 的天數比例",
     ),
     "september_wind": Proverb(
@@ -165,8 +165,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         category=ProverbCategory.TYPHOON,
         region=ProverbRegion.HOKKIEN,
         scientific_explanation="農曆九、十月（約國曆十、十一月）為秋颱季節，東北季風增強。",
-        applicable_months=[10, 11],
-        keywords=["九月", "十月", "颱風", "風"],
+        applicable_months=(10, 11),
+        keywords=("九月", "十月", "颱風", "風"),
         verification_method="計算十、十一月的平均風速和颱風頻率",
     ),
     "frost_rice_barn": Proverb(
@@ -177,8 +177,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         region=ProverbRegion.TAIWAN,
         related_solar_term="霜降",
         scientific_explanation="霜降見霜表示氣候正常，冷暖交替有序，有利於農作物成熟。",
-        applicable_months=[10],
-        keywords=["霜降", "霜", "豐收"],
+        applicable_months=(10,),
+        keywords=("霜降", "霜", "豐收"),
         verification_method="檢查霜降時期低溫與該年農產量的相關性",
         verifiable=False,  # 需要農產量數據
     ),
@@ -190,8 +190,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         category=ProverbCategory.RAIN,
         region=ProverbRegion.HOKKIEN,
         scientific_explanation="春季為竹筍生長期，此時也是春雨季節，降雨機率和雨量確實較高。",
-        applicable_months=[3, 4, 5],
-        keywords=["竹筍", "春雨", "降雨"],
+        applicable_months=(3, 4, 5),
+        keywords=("竹筍", "春雨", "降雨"),
         verification_method="計算三至五月的平均降雨量",
     ),
 
@@ -204,8 +204,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         region=ProverbRegion.CHINA,
         related_solar_term="小滿",
         scientific_explanation="此時正值臺灣梅雨季高峰期，滯留鋒面帶來連續性降雨，雨量豐沛。",
-        applicable_months=[5, 6],
-        keywords=["小滿", "梅雨", "降雨"],
+        applicable_months=(5, 6),
+        keywords=("小滿", "梅雨", "降雨"),
         verification_method="計算五月下旬至六月中旬的累積降雨量",
     ),
     "mangzhong_rain": Proverb(
@@ -216,8 +216,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         region=ProverbRegion.CHINA,
         related_solar_term="芒種",
         scientific_explanation="此時為梅雨季尾聲，高溫高濕，體感溫度高，容易不適。",
-        applicable_months=[6],
-        keywords=["芒種", "夏至", "高溫", "濕度"],
+        applicable_months=(6,),
+        keywords=("芒種", "夏至", "高溫", "濕度"),
         verification_method="計算六月平均溫度和濕度，以及體感溫度",
     ),
 
@@ -230,8 +230,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         category=ProverbCategory.TYPHOON,
         region=ProverbRegion.HOKKIEN,
         scientific_explanation="農曆七月七日約在國曆八月中旬，正值颱風旺季。",
-        applicable_months=[8],
-        keywords=["七夕", "颱風", "降雨"],
+        applicable_months=(8,),
+        keywords=("七夕", "颱風", "降雨"),
         verification_method="計算八月中旬的降雨機率和颱風侵台頻率",
     ),
     "mid_autumn_typhoon": Proverb(
@@ -242,8 +242,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         category=ProverbCategory.RAIN,
         region=ProverbRegion.HOKKIEN,
         scientific_explanation="中秋前後為秋颱季節，即使沒有颱風，東北季風也可能帶來降雨。",
-        applicable_months=[9, 10],
-        keywords=["中秋", "颱風", "降雨"],
+        applicable_months=(9, 10),
+        keywords=("中秋", "颱風", "降雨"),
         verification_method="計算中秋節當日的歷史降雨機率",
     ),
 
@@ -255,8 +255,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         category=ProverbCategory.AGRICULTURE,
         region=ProverbRegion.CHINA,
         scientific_explanation="冬季打雷表示氣候異常，可能影響作物生長週期。",
-        applicable_months=[12, 1, 2],
-        keywords=["冬天", "雷", "農業"],
+        applicable_months=(12, 1, 2),
+        keywords=("冬天", "雷", "農業"),
         verification_method="統計冬季打雷頻率",
         verifiable=False,  # 需要雷擊數據
     ),
@@ -267,8 +267,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         category=ProverbCategory.TEMPERATURE,
         region=ProverbRegion.TAIWAN,
         scientific_explanation="嘉南平原地勢平坦開闊，缺乏屏障，冷空氣容易堆積，造成輻射冷卻效應明顯。",
-        applicable_months=[12, 1, 2],
-        keywords=["寒流", "嘉南平原", "低溫"],
+        applicable_months=(12, 1, 2),
+        keywords=("寒流", "嘉南平原", "低溫"),
         verification_method="比較寒流期間各站點的最低溫差異",
     ),
     "spring_cold": Proverb(
@@ -279,8 +279,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         region=ProverbRegion.CHINA,
         related_solar_term="大雪",
         scientific_explanation="冬季暖冬可能導致大氣環流異常，造成春季出現異常低溫。",
-        applicable_months=[12, 3],
-        keywords=["大雪", "春寒", "溫度"],
+        applicable_months=(12, 3),
+        keywords=("大雪", "春寒", "溫度"),
         verification_method="檢查大雪時期溫度與隔年春季低溫的相關性",
     ),
 
@@ -292,8 +292,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         category=ProverbCategory.RAIN,
         region=ProverbRegion.CHINA,
         scientific_explanation="臺灣天氣系統由西向東移動，早上西邊有雲（朝霞）表示天氣系統將至；傍晚西邊晴朗（晚霞）表示天氣將好轉。",
-        applicable_months=list(range(1, 13)),
-        keywords=["朝霞", "晚霞", "天氣"],
+        applicable_months=tuple(range(1, 13)),
+        keywords=("朝霞", "晚霞", "天氣"),
         verification_method="需要雲況觀測數據",
         verifiable=False,
     ),
@@ -304,8 +304,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         category=ProverbCategory.RAIN,
         region=ProverbRegion.CHINA,
         scientific_explanation="螞蟻對氣壓和濕度變化敏感，下雨前氣壓降低、濕度升高，螞蟻會將巢穴移至高處。",
-        applicable_months=list(range(1, 13)),
-        keywords=["螞蟻", "降雨"],
+        applicable_months=tuple(range(1, 13)),
+        keywords=("螞蟻", "降雨"),
         verifiable=False,
     ),
     "swallow_low_fly": Proverb(
@@ -316,8 +316,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         category=ProverbCategory.RAIN,
         region=ProverbRegion.HOKKIEN,
         scientific_explanation="下雨前空氣濕度高，昆蟲飛行高度降低，燕子追逐昆蟲也跟著低飛。",
-        applicable_months=list(range(1, 13)),
-        keywords=["燕子", "降雨"],
+        applicable_months=tuple(range(1, 13)),
+        keywords=("燕子", "降雨"),
         verifiable=False,
     ),
 
@@ -329,8 +329,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         category=ProverbCategory.TEMPERATURE,
         region=ProverbRegion.TAIWAN,
         scientific_explanation="降雨前暖濕空氣聚集，氣壓低而悶熱；雨後冷空氣隨鋒面南下，氣溫下降。",
-        applicable_months=list(range(1, 13)),
-        keywords=["悶熱", "降雨", "降溫"],
+        applicable_months=tuple(range(1, 13)),
+        keywords=("悶熱", "降雨", "降溫"),
         verification_method="計算降雨日前後的溫度變化",
     ),
     "early_hot_late_cold": Proverb(
@@ -340,8 +340,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         category=ProverbCategory.TEMPERATURE,
         region=ProverbRegion.CHINA,
         scientific_explanation="臺灣春秋季節日夜溫差可達 10 度以上，尤其是盆地和平原地區。",
-        applicable_months=[3, 4, 10, 11],
-        keywords=["溫差", "日夜"],
+        applicable_months=(3, 4, 10, 11),
+        keywords=("溫差", "日夜"),
         verification_method="計算春秋季節的日均溫差",
     ),
 
@@ -353,8 +353,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         category=ProverbCategory.RAIN,
         region=ProverbRegion.HAKKA,
         scientific_explanation="春季為農作物生長關鍵期，適量降雨有利於作物發芽成長。",
-        applicable_months=[2, 3, 4],
-        keywords=["春雨", "農業"],
+        applicable_months=(2, 3, 4),
+        keywords=("春雨", "農業"),
         verification_method="計算二至四月的降雨量分布",
     ),
     "hakka_frost": Proverb(
@@ -365,8 +365,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         region=ProverbRegion.HAKKA,
         related_solar_term="霜降",
         scientific_explanation="霜降有霜表示天氣轉涼，東北季風建立，立冬前後常帶來降雨。",
-        applicable_months=[10, 11],
-        keywords=["霜降", "立冬", "霜", "降雨"],
+        applicable_months=(10, 11),
+        keywords=("霜降", "立冬", "霜", "降雨"),
         verification_method="檢查霜降低溫與立冬降雨的相關性",
     ),
 
@@ -379,8 +379,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         region=ProverbRegion.CHINA,
         related_solar_term="芒種",
         scientific_explanation="芒種前後為水稻插秧期，適量降雨有利於秧苗存活。",
-        applicable_months=[6],
-        keywords=["芒種", "端午", "降雨", "豐收"],
+        applicable_months=(6,),
+        keywords=("芒種", "端午", "降雨", "豐收"),
         verification_method="計算六月初（端午前後）的降雨機率",
     ),
     "double_ninth": Proverb(
@@ -390,8 +390,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         category=ProverbCategory.RAIN,
         region=ProverbRegion.CHINA,
         scientific_explanation="重陽節約在國曆十月，若此時缺乏降雨，可能意味著整個冬季降雨偏少。",
-        applicable_months=[10],
-        keywords=["重陽", "冬季", "乾旱"],
+        applicable_months=(10,),
+        keywords=("重陽", "冬季", "乾旱"),
         verification_method="檢查重陽降雨與該年冬季降雨量的相關性",
     ),
 
@@ -404,8 +404,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         region=ProverbRegion.CHINA,
         related_solar_term="夏至",
         scientific_explanation="夏至是北半球白晝最長的一天，之後日照時數逐日減少。",
-        applicable_months=[6, 7],
-        keywords=["夏至", "日照", "白天"],
+        applicable_months=(6, 7),
+        keywords=("夏至", "日照", "白天"),
         verification_method="計算夏至前後日照時數變化",
     ),
     "autumn_tiger": Proverb(
@@ -416,8 +416,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         region=ProverbRegion.CHINA,
         related_solar_term="處暑",
         scientific_explanation="處暑雖名為「暑氣結束」，但臺灣此時仍受太平洋高壓影響，常有高溫。",
-        applicable_months=[8, 9],
-        keywords=["處暑", "秋老虎", "高溫"],
+        applicable_months=(8, 9),
+        keywords=("處暑", "秋老虎", "高溫"),
         verification_method="計算八月下旬至九月上旬的高溫天數",
     ),
     "three_fu_days": Proverb(
@@ -428,8 +428,8 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         region=ProverbRegion.CHINA,
         related_solar_term="小暑",
         scientific_explanation="小暑、大暑期間是一年中最熱的時候，高溫高濕，體感如同蒸煮。",
-        applicable_months=[7],
-        keywords=["小暑", "大暑", "高溫"],
+        applicable_months=(7,),
+        keywords=("小暑", "大暑", "高溫"),
         verification_method="計算七月的平均最高溫和超過 35°C 的天數",
     ),
     "cold_in_nine": Proverb(
@@ -440,16 +440,48 @@ PROVERBS_DATABASE: dict[str, Proverb] = {
         region=ProverbRegion.CHINA,
         related_solar_term="小寒",
         scientific_explanation="小寒、大寒期間太陽直射南半球，北半球獲得熱量最少，加上冷氣團頻繁，氣溫最低。",
-        applicable_months=[1],
-        keywords=["小寒", "大寒", "低溫"],
+        applicable_months=(1,),
+        keywords=("小寒", "大寒", "低溫"),
         verification_method="計算一月的平均最低溫和低於 10°C 的天數",
     ),
 }
 
 
-def get_all_proverbs() -> list[Proverb]:
+# ============================================
+# 查詢索引（資料庫於執行期不變，載入時預先建立）
+# 回傳的 tuple 為共用物件，呼叫端請勿修改
+# ============================================
+
+_ALL_PROVERBS: tuple[Proverb, ...] = tuple(PROVERBS_DATABASE.values())
+
+
+def _build_index(key: Callable[[Proverb], list]) -> dict:
+    """依 key 函式建立 值 → 諺語 tuple 的反向索引"""
+    index: dict = {}
+    for p in _ALL_PROVERBS:
+        for k in key(p):
+            index.setdefault(k, []).append(p)
+    return {k: tuple(v) for k, v in index.items()}
+
+
+_BY_CATEGORY: dict[ProverbCategory, tuple[Proverb, ...]] = _build_index(lambda p: [p.category])
+_BY_REGION: dict[ProverbRegion, tuple[Proverb, ...]] = _build_index(lambda p: [p.region])
+_BY_SOLAR_TERM: dict[str, tuple[Proverb, ...]] = _build_index(
+    lambda p: [p.related_solar_term] if p.related_solar_term else []
+)
+_BY_MONTH: dict[int, tuple[Proverb, ...]] = _build_index(lambda p: set(p.applicable_months))
+_VERIFIABLE: tuple[Proverb, ...] = tuple(p for p in _ALL_PROVERBS if p.verifiable)
+
+# 搜尋用的小寫全文（原文、解釋、關鍵字以換行分隔，避免跨欄位誤配）
+_SEARCH_HAYSTACK: tuple[tuple[Proverb, str], ...] = tuple(
+    (p, "\n".join([p.text, p.meaning, *p.keywords]).lower())
+    for p in _ALL_PROVERBS
+)
+
+
+def get_all_proverbs() -> tuple[Proverb, ...]:
     """取得所有諺語"""
-    return list(PROVERBS_DATABASE.values())
+    return _ALL_PROVERBS
 
 
 def get_proverb_by_id(proverb_id: str) -> Optional[Proverb]:
@@ -457,38 +489,32 @@ def get_proverb_by_id(proverb_id: str) -> Optional[Proverb]:
     return PROVERBS_DATABASE.get(proverb_id)
 
 
-def get_proverbs_by_category(category: ProverbCategory) -> list[Proverb]:
+def get_proverbs_by_category(category: ProverbCategory) -> tuple[Proverb, ...]:
     """依分類取得諺語"""
-    return [p for p in PROVERBS_DATABASE.values() if p.category == category]
+    return _BY_CATEGORY.get(category, ())
 
 
-def get_proverbs_by_region(region: ProverbRegion) -> list[Proverb]:
+def get_proverbs_by_region(region: ProverbRegion) -> tuple[Proverb, ...]:
     """依地區取得諺語"""
-    return [p for p in PROVERBS_DATABASE.values() if p.region == region]
+    return _BY_REGION.get(region, ())
 
 
-def get_proverbs_by_solar_term(solar_term: str) -> list[Proverb]:
+def get_proverbs_by_solar_term(solar_term: str) -> tuple[Proverb, ...]:
     """依相關節氣取得諺語"""
-    return [p for p in PROVERBS_DATABASE.values() if p.related_solar_term == solar_term]
+    return _BY_SOLAR_TERM.get(solar_term, ())
 
 
-def get_proverbs_by_month(month: int) -> list[Proverb]:
+def get_proverbs_by_month(month: int) -> tuple[Proverb, ...]:
     """依月份取得適用的諺語"""
-    return [p for p in PROVERBS_DATABASE.values() if month in p.applicable_months]
+    return _BY_MONTH.get(month, ())
 
 
-def get_verifiable_proverbs() -> list[Proverb]:
+def get_verifiable_proverbs() -> tuple[Proverb, ...]:
     """取得可驗證的諺語列表"""
-    return [p for p in PROVERBS_DATABASE.values() if p.verifiable]
+    return _VERIFIABLE
 
 
-def search_proverbs(keyword: str) -> list[Proverb]:
+def search_proverbs(keyword: str) -> tuple[Proverb, ...]:
     """搜尋諺語（在原文、解釋、關鍵字中搜尋）"""
     keyword = keyword.lower()
-    results = []
-    for p in PROVERBS_DATABASE.values():
-        if (keyword in p.text.lower() or
-            keyword in p.meaning.lower() or
-            any(keyword in kw.lower() for kw in p.keywords)):
-            results.append(p)
-    return results
+    return tuple(p for p, haystack in _SEARCH_HAYSTACK if keyword in haystack)
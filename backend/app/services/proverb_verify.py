@@ -4,16 +4,33 @@
 使用 36 年歷史氣象數據驗證諺語準確率。
 """
 
-from datetime import date, timedelta
-from typing import Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache, wraps
+from typing import Callable, Optional
 from dataclasses import dataclass
-import statistics
+import logging
 import math
+import threading
+import time
 
-from sqlalchemy import func, extract, and_, or_
-from sqlalchemy.orm import Session
-
-from app.models import RawObservation, DailyStatistics
+import numpy as np
+from sqlalchemy import (
+    Date, Float, Integer, and_, case, cast, extract, false, func, literal, or_, select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models import (
+    DailyStatistics,
+    MonthlyStatistics,
+    ProverbVerificationCache,
+    RawObservation,
+)
 from app.services.proverb import (
     Proverb,
     ProverbVerification,
@@ -21,8 +38,10 @@ from app.services.proverb import (
     get_verifiable_proverbs,
 )
 
+logger = logging.getLogger(__name__)
+
 
-@dataclass
+@dataclass(slots=True)
 class VerificationResult:
     """驗證結果"""
     proverb_id: str
@@ -33,43 +52,237 @@ class VerificationResult:
     data_quality: str      # 資料品質說明
 
 
+# 資料最完整站點的快取（monotonic 時間戳, station_id）
+_DEFAULT_STATION_TTL = 300  # 秒
+_default_station: Optional[tuple[float, str]] = None
+
+
 def _get_station_with_most_data(db: Session) -> str:
-    """取得資料最完整的站點（通常是臺北站）"""
+    """取得資料最完整的站點（通常是臺北站）
+
+    站點排名只會在匯入新資料後改變，結果快取 _DEFAULT_STATION_TTL 秒，
+    避免每次請求都對整張觀測表做 GROUP BY。
+    """
+    global _default_station
+
+    now = time.monotonic()
+    if _default_station and now - _default_station[0] < _DEFAULT_STATION_TTL:
+        return _default_station[1]
+
     result = db.query(
         RawObservation.station_id,
         func.count(RawObservation.id).label('count')
     ).group_by(RawObservation.station_id).order_by(func.count(RawObservation.id).desc()).first()
-    return result[0] if result else "466920"
+    station_id = result[0] if result else "466920"
+
+    _default_station = (now, station_id)
+    return station_id
+
+
+def _resolve_station_id(db: Session, station_id: Optional[str]) -> str:
+    """解析站點 ID，未指定時使用資料最完整的站點
+
+    同一個 session 內只解析一次，結果記在 db.info，
+    讓摘要 → 全部驗證 → 單一驗證這類串接呼叫不必重複查詢。
+    """
+    if station_id:
+        return station_id
+    if "default_station_id" not in db.info:
+        db.info["default_station_id"] = _get_station_with_most_data(db)
+    return db.info["default_station_id"]
+
+
+# 節氣典型日期對照表（月, 日）
+_TERM_DATES: dict[str, tuple[int, int]] = {
+    "立春": (2, 4), "雨水": (2, 19), "驚蟄": (3, 6), "春分": (3, 21),
+    "清明": (4, 5), "穀雨": (4, 20), "立夏": (5, 6), "小滿": (5, 21),
+    "芒種": (6, 6), "夏至": (6, 21), "小暑": (7, 7), "大暑": (7, 23),
+    "立秋": (8, 8), "處暑": (8, 23), "白露": (9, 8), "秋分": (9, 23),
+    "寒露": (10, 8), "霜降": (10, 24), "立冬": (11, 8), "小雪": (11, 22),
+    "大雪": (12, 7), "冬至": (12, 22), "小寒": (1, 6), "大寒": (1, 20),
+}
 
 
+@lru_cache(maxsize=4096)
 def _get_solar_term_date(year: int, term_name: str) -> Optional[date]:
     """取得某年特定節氣的大約日期
 
     注：這是根據典型日期的近似值，實際節氣日期可能有 1-2 天誤差
     """
-    # 節氣典型日期對照表
-    term_dates = {
-        "立春": (2, 4), "雨水": (2, 19), "驚蟄": (3, 6), "春分": (3, 21),
-        "清明": (4, 5), "穀雨": (4, 20), "立夏": (5, 6), "小滿": (5, 21),
-        "芒種": (6, 6), "夏至": (6, 21), "小暑": (7, 7), "大暑": (7, 23),
-        "立秋": (8, 8), "處暑": (8, 23), "白露": (9, 8), "秋分": (9, 23),
-        "寒露": (10, 8), "霜降": (10, 24), "立冬": (11, 8), "小雪": (11, 22),
-        "大雪": (12, 7), "冬至": (12, 22), "小寒": (1, 6), "大寒": (1, 20),
-    }
-
-    if term_name not in term_dates:
+    if term_name not in _TERM_DATES:
         return None
 
-    month, day = term_dates[term_name]
+    month, day = _TERM_DATES[term_name]
     try:
         return date(year, month, day)
     except ValueError:
         return None
 
 
-def _has_precipitation(precip: Optional[float], threshold: float = 0.1) -> bool:
-    """判斷是否有降水"""
-    return precip is not None and precip >= threshold
+def _year_windows(rows: list[tuple], names: tuple[str, ...]):
+    """將每年的節氣日期轉成可 JOIN 的子查詢
+
+    Args:
+        rows: [(year, date1, date2, ...), ...]，year 之後的欄位可為 date 或 int
+        names: 欄位名稱，對應 rows 中 year 之後的各欄
+
+    SQLite 不支援 VALUES 子查詢的欄位別名，因此以 UNION ALL 組成。
+    """
+    selects = [
+        select(
+            literal(row[0], Integer).label("year"),
+            *(
+                literal(value, Integer if isinstance(value, int) else Date).label(name)
+                for name, value in zip(names, row[1:])
+            ),
+        )
+        for row in rows
+    ]
+    return union_all(*selects).subquery("windows")
+
+
+def _station_years(db: Session, station_id: str) -> list[int]:
+    """取得站點有觀測資料的年份（缺資料的年份不列入）
+
+    年份由 observed_date 取出，可直接以 (station_id, observed_date) 索引涵蓋，
+    不需讀取資料列。
+    """
+    year = extract("year", RawObservation.observed_date)
+    rows = db.query(year).filter(
+        RawObservation.station_id == station_id
+    ).distinct().order_by(year).all()
+    return [int(row[0]) for row in rows]
+
+
+def _get_years(db: Session, station_id: str) -> list[int]:
+    """取得站點涵蓋的年份
+
+    verify_all_proverbs 執行期間會先算好放在 db.info["station_years"]，
+    各驗證函數直接沿用，不必各自查詢。
+    """
+    years = db.info.get("station_years", {}).get(station_id)
+    if years is None:
+        years = _station_years(db, station_id)
+    return years
+
+
+def _yearly_period(years: list[int], start: tuple[int, int], end: tuple[int, int]):
+    """每年 start ~ end（月, 日）的日期區間條件
+
+    以明確的日期範圍取代 extract(month/day)，讓資料庫能用
+    (station_id, observed_date) 索引做範圍掃描。
+    """
+    if not years:
+        return false()
+    return or_(*(
+        RawObservation.observed_date.between(date(year, *start), date(year, *end))
+        for year in years
+    ))
+
+
+# 原生支援 stddev_samp 聚合函數的資料庫方言
+_STDDEV_DIALECTS = frozenset({"postgresql", "mysql", "mariadb", "oracle"})
+
+# 春季至夏季（3/1 - 8/31）
+_SPRING_SUMMER = ((3, 1), (8, 31))
+
+# 春季、夏季各自的每年期間
+_SEASON_PERIODS = {
+    "spring": ((3, 1), (5, 31)),
+    "summer": ((6, 1), (8, 31)),
+}
+
+# 串流讀取每日溫差時每批筆數
+_STREAM_BATCH_SIZE = 2000
+
+
+def _daily_range_spread(db: Session, station_id: str) -> dict[str, tuple[int, Optional[float]]]:
+    """計算春季（3-5月）與夏季（6-8月）每日溫差的筆數與樣本標準差
+
+    資料庫支援 stddev_samp 時在資料庫端彙總，只回傳兩列；
+    否則（如 SQLite）以 yield_per 分批串流每日溫差至 NumPy 陣列計算。
+
+    Returns:
+        {"spring": (筆數, 標準差), "summer": (筆數, 標準差)}，筆數少於 2 時標準差為 None
+    """
+    if db.get_bind().dialect.name in _STDDEV_DIALECTS:
+        diff = RawObservation.temperature_max - RawObservation.temperature_min
+        month = RawObservation.observed_month
+        season = case((month.in_([3, 4, 5]), "spring"), else_="summer").label("season")
+        rows = db.query(
+            season,
+            func.count(diff),
+            func.stddev_samp(diff),
+        ).filter(
+            RawObservation.station_id == station_id,
+            _yearly_period(_get_years(db, station_id), *_SPRING_SUMMER),
+            RawObservation.temperature_max.isnot(None),
+            RawObservation.temperature_min.isnot(None),
+        ).group_by(season).all()
+
+        spread = {"spring": (0, None), "summer": (0, None)}
+        for name, count, std in rows:
+            spread[name] = (count, float(std) if std is not None else None)
+        return spread
+
+    years = _get_years(db, station_id)
+    diff = RawObservation.temperature_max - RawObservation.temperature_min
+
+    spread = {}
+    for name, period in _SEASON_PERIODS.items():
+        stmt = select(diff).where(
+            RawObservation.station_id == station_id,
+            _yearly_period(years, *period),
+            RawObservation.temperature_max.isnot(None),
+            RawObservation.temperature_min.isnot(None),
+        )
+        rows = db.execute(stmt).yield_per(_STREAM_BATCH_SIZE)
+        values = np.fromiter((row[0] for row in rows), dtype=np.float64, count=-1)
+        std = float(np.std(values, ddof=1)) if len(values) > 1 else None
+        spread[name] = (len(values), std)
+    return spread
+
+
+def _monthly_temperature(
+    db: Session,
+    station_id: str,
+    month: int,
+    excluded_months: tuple[int, ...],
+    field: str,
+) -> Optional[tuple[Optional[float], int, int, Optional[float]]]:
+    """從每月統計快照取得指定月份的溫度統計與對照月份平均
+
+    Args:
+        field: "max"（最高溫、35°C 以上天數）或 "min"（最低溫、10°C 以下天數）
+        excluded_months: 不列入對照組的月份
+
+    Returns:
+        (當月平均, 當月天數, 極端天數, 對照月份平均)；站點尚未計算快照時回傳 None
+    """
+    rows = db.query(MonthlyStatistics).filter(
+        MonthlyStatistics.station_id == station_id
+    ).all()
+    if not rows:
+        return None
+
+    mean_attr, count_attr, extreme_attr = (
+        ("temp_max_mean", "temp_max_count", "hot_days_35") if field == "max"
+        else ("temp_min_mean", "temp_min_count", "cold_days_10")
+    )
+
+    target_mean, target_count, extreme_days = None, 0, 0
+    other_total, other_count = 0.0, 0
+    for row in rows:
+        mean, count = getattr(row, mean_attr), getattr(row, count_attr)
+        if row.month == month:
+            target_mean, target_count = mean, count
+            extreme_days = getattr(row, extreme_attr)
+        elif row.month not in excluded_months and mean is not None:
+            other_total += mean * count
+            other_count += count
+
+    other_avg = other_total / other_count if other_count else None
+    return target_mean, target_count, extreme_days, other_avg
 
 
 def _interpret_accuracy(rate: float) -> str:
@@ -96,65 +309,152 @@ def _confidence_level(sample_count: int, rate: float) -> str:
         return "低"
 
 
+# ============================================
+# 驗證結果快取
+# ============================================
+
+# (驗證函數名稱, station_id, 資料指紋) → VerificationResult，最多保留 256 筆
+_VERIFICATION_CACHE: OrderedDict[tuple, VerificationResult] = OrderedDict()
+_VERIFICATION_CACHE_SIZE = 256
+_verification_cache_lock = threading.Lock()
+
+
+def _data_fingerprint(db: Session, station_id: str) -> tuple:
+    """站點資料的版本指紋（觀測最大 id, 最新觀測日期, 每月統計快照計算時間）
+
+    歷史資料只會因匯入而增加，指紋不變即代表驗證結果不變；
+    每月統計快照重算後也會讓使用快照的驗證結果失效。
+    各個 MAX 以純量子查詢取得，皆可由索引直接定位，不需掃描資料。
+    verify_all_proverbs 執行期間沿用 db.info["data_fingerprint"]。
+    """
+    fingerprint = db.info.get("data_fingerprint", {}).get(station_id)
+    if fingerprint is not None:
+        return fingerprint
+
+    is_station = RawObservation.station_id == station_id
+    return tuple(db.execute(select(
+        select(func.max(RawObservation.id)).where(is_station).scalar_subquery(),
+        select(func.max(RawObservation.observed_date)).where(is_station).scalar_subquery(),
+        select(func.max(MonthlyStatistics.computed_at)).where(
+            MonthlyStatistics.station_id == station_id
+        ).scalar_subquery(),
+    )).one())
+
+
+def _cached_verification(
+    verify_func: Callable[[Session, str, Optional[Proverb]], VerificationResult],
+):
+    """依 (驗證函數, 站點, 資料指紋) 快取驗證結果
+
+    回傳的 VerificationResult 為共用物件，呼叫端請勿修改。
+    """
+    @wraps(verify_func)
+    def wrapper(
+        db: Session, station_id: str, proverb: Optional[Proverb] = None,
+    ) -> VerificationResult:
+        key = (verify_func.__name__, station_id, _data_fingerprint(db, station_id))
+        with _verification_cache_lock:
+            cached = _VERIFICATION_CACHE.get(key)
+            if cached is not None:
+                _VERIFICATION_CACHE.move_to_end(key)
+                return cached
+
+        result = verify_func(db, station_id, proverb)
+
+        with _verification_cache_lock:
+            _VERIFICATION_CACHE[key] = result
+            if len(_VERIFICATION_CACHE) > _VERIFICATION_CACHE_SIZE:
+                _VERIFICATION_CACHE.popitem(last=False)
+        return result
+
+    return wrapper
+
+
+def _all_cached(station_id: str, fingerprint: tuple) -> bool:
+    """站點所有驗證函數在此資料指紋下是否都已有快取結果"""
+    with _verification_cache_lock:
+        return all(
+            (verify_func.__name__, station_id, fingerprint) in _VERIFICATION_CACHE
+            for verify_func in VERIFICATION_FUNCTIONS.values()
+        )
+
+
+def clear_verification_cache() -> None:
+    """清除驗證結果快取"""
+    with _verification_cache_lock:
+        _VERIFICATION_CACHE.clear()
+
+
 # ============================================
 # 個別諺語驗證函數
 # ============================================
 
-def verify_lichun_rain(db: Session, station_id: str) -> VerificationResult:
+@_cached_verification
+def verify_lichun_rain(
+    db: Session, station_id: str, proverb: Optional[Proverb] = None,
+) -> VerificationResult:
     """驗證「立春落雨透清明」
 
     邏輯：立春日有雨的年份，檢查立春到清明期間的降雨天數是否高於平均
     """
-    proverb = get_proverb_by_id("lichun_rain")
+    proverb = proverb or get_proverb_by_id("lichun_rain")
 
-    # 取得所有年份的資料範圍
-    years_query = db.query(
-        extract('year', RawObservation.observed_date).label('year')
-    ).filter(
-        RawObservation.station_id == station_id
-    ).distinct().all()
-
-    years = [int(y[0]) for y in years_query]
+    years = _get_years(db, station_id)
 
     total_cases = 0  # 立春有雨的年數
     positive_cases = 0  # 立春有雨且清明前多雨的年數
     sample_years = []
 
+    term_rows = []
     for year in years:
         lichun_date = _get_solar_term_date(year, "立春")
         qingming_date = _get_solar_term_date(year, "清明")
+        if lichun_date and qingming_date:
+            term_rows.append((
+                year, lichun_date, qingming_date, (qingming_date - lichun_date).days,
+            ))
 
-        if not lichun_date or not qingming_date:
-            continue
-
-        # 檢查立春當天是否有雨
-        lichun_obs = db.query(RawObservation).filter(
-            RawObservation.station_id == station_id,
-            RawObservation.observed_date == lichun_date
-        ).first()
-
-        if not lichun_obs or not _has_precipitation(lichun_obs.precipitation):
-            continue
-
-        # 立春有雨
-        total_cases += 1
-        sample_years.append(year)
+    if term_rows:
+        windows = _year_windows(term_rows, ("lichun", "qingming", "total_days"))
+        is_rainy = RawObservation.precipitation >= 0.1
+        rainy_days = func.sum(case(
+            (and_(RawObservation.observed_date > windows.c.lichun, is_rainy), 1),
+            else_=0,
+        ))
+
+        # 一次查詢取得每年「立春是否有雨」與「立春後至清明的降雨天數佔比」
+        yearly = db.query(
+            windows.c.year,
+            func.sum(case(
+                (and_(RawObservation.observed_date == windows.c.lichun, is_rainy), 1),
+                else_=0,
+            )).label("lichun_rain"),
+            case(
+                (windows.c.total_days > 0, cast(rainy_days, Float) / windows.c.total_days),
+                else_=0,
+            ).label("rain_ratio"),
+        ).select_from(windows).join(
+            RawObservation,
+            and_(
+                RawObservation.station_id == station_id,
+                RawObservation.observed_date >= windows.c.lichun,
+                RawObservation.observed_date <= windows.c.qingming,
+            ),
+        ).group_by(
+            windows.c.year, windows.c.lichun, windows.c.total_days
+        ).order_by(windows.c.year).all()
 
-        # 計算立春到清明期間的降雨天數
-        rainy_days = db.query(func.count(RawObservation.id)).filter(
-            RawObservation.station_id == station_id,
-            RawObservation.observed_date > lichun_date,
-            RawObservation.observed_date <= qingming_date,
-            RawObservation.precipitation >= 0.1
-        ).scalar() or 0
+        for row in yearly:
+            if not row.lichun_rain:
+                continue
 
-        # 計算總天數
-        total_days = (qingming_date - lichun_date).days
-        rain_ratio = rainy_days / total_days if total_days > 0 else 0
+            # 立春有雨
+            total_cases += 1
+            sample_years.append(row.year)
 
-        # 如果降雨天數超過 40%，視為「透清明」
-        if rain_ratio >= 0.4:
-            positive_cases += 1
+            # 如果降雨天數超過 40%，視為「透清明」
+            if row.rain_ratio >= 0.4:
+                positive_cases += 1
 
     accuracy = positive_cases / total_cases if total_cases > 0 else 0
 
@@ -175,53 +475,55 @@ def verify_lichun_rain(db: Session, station_id: str) -> VerificationResult:
     )
 
 
-def verify_qingming_rain(db: Session, station_id: str) -> VerificationResult:
+@_cached_verification
+def verify_qingming_rain(
+    db: Session, station_id: str, proverb: Optional[Proverb] = None,
+) -> VerificationResult:
     """驗證「清明時節雨紛紛」
 
     邏輯：計算清明節前後一週的歷史降雨機率
     """
-    proverb = get_proverb_by_id("qingming_rain")
-
-    years_query = db.query(
-        extract('year', RawObservation.observed_date).label('year')
-    ).filter(
-        RawObservation.station_id == station_id
-    ).distinct().all()
+    proverb = proverb or get_proverb_by_id("qingming_rain")
 
-    years = [int(y[0]) for y in years_query]
+    years = _get_years(db, station_id)
 
     total_cases = 0
     positive_cases = 0
     sample_years = []
 
+    # 清明前後一週（共 15 天）
+    window_rows = []
     for year in years:
         qingming_date = _get_solar_term_date(year, "清明")
-        if not qingming_date:
-            continue
-
-        # 清明前後一週（共 15 天）
-        start_date = qingming_date - timedelta(days=7)
-        end_date = qingming_date + timedelta(days=7)
-
-        # 計算這期間的降雨天數
-        rainy_days = db.query(func.count(RawObservation.id)).filter(
-            RawObservation.station_id == station_id,
-            RawObservation.observed_date >= start_date,
-            RawObservation.observed_date <= end_date,
-            RawObservation.precipitation >= 0.1
-        ).scalar() or 0
+        if qingming_date:
+            window_rows.append((
+                year, qingming_date - timedelta(days=7), qingming_date + timedelta(days=7),
+            ))
 
-        total_days = db.query(func.count(RawObservation.id)).filter(
-            RawObservation.station_id == station_id,
-            RawObservation.observed_date >= start_date,
-            RawObservation.observed_date <= end_date
-        ).scalar() or 0
+    yearly = []
+    if window_rows:
+        windows = _year_windows(window_rows, ("start", "end"))
+        total_days = func.count(RawObservation.id)
+        rainy_days = func.sum(case((RawObservation.precipitation >= 0.1, 1), else_=0))
+        yearly = db.query(
+            windows.c.year,
+            total_days.label("total_days"),
+            (cast(rainy_days, Float) / total_days).label("rain_ratio"),
+        ).select_from(windows).join(
+            RawObservation,
+            and_(
+                RawObservation.station_id == station_id,
+                RawObservation.observed_date >= windows.c.start,
+                RawObservation.observed_date <= windows.c.end,
+            ),
+        ).group_by(windows.c.year).order_by(windows.c.year).all()
 
-        if total_days >= 10:  # 至少要有 10 天資料
+    for row in yearly:
+        if row.total_days >= 10:  # 至少要有 10 天資料
             total_cases += 1
-            sample_years.append(year)
+            sample_years.append(row.year)
             # 如果超過 50% 天數有雨，視為「雨紛紛」
-            if rainy_days / total_days >= 0.5:
+            if row.rain_ratio >= 0.5:
                 positive_cases += 1
 
     accuracy = positive_cases / total_cases if total_cases > 0 else 0
@@ -243,47 +545,59 @@ def verify_qingming_rain(db: Session, station_id: str) -> VerificationResult:
     )
 
 
-def verify_xiazhi_heat(db: Session, station_id: str) -> VerificationResult:
+@_cached_verification
+def verify_xiazhi_heat(
+    db: Session, station_id: str, proverb: Optional[Proverb] = None,
+) -> VerificationResult:
     """驗證「夏至不過不熱」
 
     邏輯：比較夏至前後各 30 天的平均最高溫
     """
-    proverb = get_proverb_by_id("xiazhi_heat")
-
-    years_query = db.query(
-        extract('year', RawObservation.observed_date).label('year')
-    ).filter(
-        RawObservation.station_id == station_id
-    ).distinct().all()
+    proverb = proverb or get_proverb_by_id("xiazhi_heat")
 
-    years = [int(y[0]) for y in years_query]
+    years = _get_years(db, station_id)
 
     total_cases = 0
     positive_cases = 0
     sample_years = []
     temp_diffs = []
 
+    window_rows = []
     for year in years:
         xiazhi_date = _get_solar_term_date(year, "夏至")
-        if not xiazhi_date:
-            continue
-
-        # 夏至前 30 天平均最高溫
-        before_temps = db.query(func.avg(RawObservation.temperature_max)).filter(
-            RawObservation.station_id == station_id,
-            RawObservation.observed_date >= xiazhi_date - timedelta(days=30),
-            RawObservation.observed_date < xiazhi_date,
-            RawObservation.temperature_max.isnot(None)
-        ).scalar()
+        if xiazhi_date:
+            window_rows.append((
+                year,
+                xiazhi_date - timedelta(days=30),
+                xiazhi_date,
+                xiazhi_date + timedelta(days=30),
+            ))
 
-        # 夏至後 30 天平均最高溫
-        after_temps = db.query(func.avg(RawObservation.temperature_max)).filter(
-            RawObservation.station_id == station_id,
-            RawObservation.observed_date > xiazhi_date,
-            RawObservation.observed_date <= xiazhi_date + timedelta(days=30),
-            RawObservation.temperature_max.isnot(None)
-        ).scalar()
+    yearly = []
+    if window_rows:
+        windows = _year_windows(window_rows, ("start", "term", "end"))
+        observed = RawObservation.observed_date
+        yearly = db.query(
+            windows.c.year,
+            # 夏至前 30 天平均
+            func.avg(case(
+                (observed < windows.c.term, RawObservation.temperature_max),
+            )).label("before_temps"),
+            # 夏至後 30 天平均
+            func.avg(case(
+                (observed > windows.c.term, RawObservation.temperature_max),
+            )).label("after_temps"),
+        ).select_from(windows).join(
+            RawObservation,
+            and_(
+                RawObservation.station_id == station_id,
+                observed >= windows.c.start,
+                observed <= windows.c.end,
+                RawObservation.temperature_max.isnot(None),
+            ),
+        ).group_by(windows.c.year).order_by(windows.c.year).all()
 
+    for year, before_temps, after_temps in yearly:
         if before_temps and after_temps:
             total_cases += 1
             sample_years.append(year)
@@ -294,7 +608,7 @@ def verify_xiazhi_heat(db: Session, station_id: str) -> VerificationResult:
                 positive_cases += 1
 
     accuracy = positive_cases / total_cases if total_cases > 0 else 0
-    avg_diff = sum(temp_diffs) / len(temp_diffs) if temp_diffs else 0
+    avg_diff = float(np.mean(temp_diffs)) if temp_diffs else 0
 
     return VerificationResult(
         proverb_id=proverb.id,
@@ -313,47 +627,59 @@ def verify_xiazhi_heat(db: Session, station_id: str) -> VerificationResult:
     )
 
 
-def verify_dongzhi_cold(db: Session, station_id: str) -> VerificationResult:
+@_cached_verification
+def verify_dongzhi_cold(
+    db: Session, station_id: str, proverb: Optional[Proverb] = None,
+) -> VerificationResult:
     """驗證「冬至不過不寒」
 
     邏輯：比較冬至前後各 30 天的平均最低溫
     """
-    proverb = get_proverb_by_id("dongzhi_cold")
-
-    years_query = db.query(
-        extract('year', RawObservation.observed_date).label('year')
-    ).filter(
-        RawObservation.station_id == station_id
-    ).distinct().all()
+    proverb = proverb or get_proverb_by_id("dongzhi_cold")
 
-    years = [int(y[0]) for y in years_query]
+    years = _get_years(db, station_id)
 
     total_cases = 0
     positive_cases = 0
     sample_years = []
     temp_diffs = []
 
+    window_rows = []
     for year in years:
         dongzhi_date = _get_solar_term_date(year, "冬至")
-        if not dongzhi_date:
-            continue
-
-        # 冬至前 30 天平均最低溫
-        before_temps = db.query(func.avg(RawObservation.temperature_min)).filter(
-            RawObservation.station_id == station_id,
-            RawObservation.observed_date >= dongzhi_date - timedelta(days=30),
-            RawObservation.observed_date < dongzhi_date,
-            RawObservation.temperature_min.isnot(None)
-        ).scalar()
+        if dongzhi_date:
+            window_rows.append((
+                year,
+                dongzhi_date - timedelta(days=30),
+                dongzhi_date,
+                dongzhi_date + timedelta(days=30),
+            ))
 
-        # 冬至後 30 天平均最低溫
-        after_temps = db.query(func.avg(RawObservation.temperature_min)).filter(
-            RawObservation.station_id == station_id,
-            RawObservation.observed_date > dongzhi_date,
-            RawObservation.observed_date <= dongzhi_date + timedelta(days=30),
-            RawObservation.temperature_min.isnot(None)
-        ).scalar()
+    yearly = []
+    if window_rows:
+        windows = _year_windows(window_rows, ("start", "term", "end"))
+        observed = RawObservation.observed_date
+        yearly = db.query(
+            windows.c.year,
+            # 冬至前 30 天平均
+            func.avg(case(
+                (observed < windows.c.term, RawObservation.temperature_min),
+            )).label("before_temps"),
+            # 冬至後 30 天平均
+            func.avg(case(
+                (observed > windows.c.term, RawObservation.temperature_min),
+            )).label("after_temps"),
+        ).select_from(windows).join(
+            RawObservation,
+            and_(
+                RawObservation.station_id == station_id,
+                observed >= windows.c.start,
+                observed <= windows.c.end,
+                RawObservation.temperature_min.isnot(None),
+            ),
+        ).group_by(windows.c.year).order_by(windows.c.year).all()
 
+    for year, before_temps, after_temps in yearly:
         if before_temps and after_temps:
             total_cases += 1
             sample_years.append(year)
@@ -364,7 +690,7 @@ def verify_dongzhi_cold(db: Session, station_id: str) -> VerificationResult:
                 positive_cases += 1
 
     accuracy = positive_cases / total_cases if total_cases > 0 else 0
-    avg_diff = sum(temp_diffs) / len(temp_diffs) if temp_diffs else 0
+    avg_diff = float(np.mean(temp_diffs)) if temp_diffs else 0
 
     return VerificationResult(
         proverb_id=proverb.id,
@@ -383,37 +709,22 @@ def verify_dongzhi_cold(db: Session, station_id: str) -> VerificationResult:
     )
 
 
-def verify_spring_mother_face(db: Session, station_id: str) -> VerificationResult:
+@_cached_verification
+def verify_spring_mother_face(
+    db: Session, station_id: str, proverb: Optional[Proverb] = None,
+) -> VerificationResult:
     """驗證「春天後母面」
 
     邏輯：計算春季（3-5月）每日溫差的變異程度
     """
-    proverb = get_proverb_by_id("spring_mother_face")
+    proverb = proverb or get_proverb_by_id("spring_mother_face")
 
-    # 計算春季（3-5月）每日最高最低溫差
-    spring_diffs = db.query(
-        (RawObservation.temperature_max - RawObservation.temperature_min).label('diff')
-    ).filter(
-        RawObservation.station_id == station_id,
-        extract('month', RawObservation.observed_date).in_([3, 4, 5]),
-        RawObservation.temperature_max.isnot(None),
-        RawObservation.temperature_min.isnot(None)
-    ).all()
+    # 春季（3-5月）與夏季（6-8月，對照組）每日最高最低溫差的筆數與標準差
+    spread = _daily_range_spread(db, station_id)
+    spring_count, spring_std = spread["spring"]
+    summer_count, summer_std = spread["summer"]
 
-    # 計算夏季（6-8月）每日溫差作為對照
-    summer_diffs = db.query(
-        (RawObservation.temperature_max - RawObservation.temperature_min).label('diff')
-    ).filter(
-        RawObservation.station_id == station_id,
-        extract('month', RawObservation.observed_date).in_([6, 7, 8]),
-        RawObservation.temperature_max.isnot(None),
-        RawObservation.temperature_min.isnot(None)
-    ).all()
-
-    spring_values = [d[0] for d in spring_diffs if d[0] is not None]
-    summer_values = [d[0] for d in summer_diffs if d[0] is not None]
-
-    if len(spring_values) < 100 or len(summer_values) < 100:
+    if spring_count < 100 or summer_count < 100:
         return VerificationResult(
             proverb_id=proverb.id,
             proverb_text=proverb.text,
@@ -430,11 +741,6 @@ def verify_spring_mother_face(db: Session, station_id: str) -> VerificationResul
             data_quality="資料不足",
         )
 
-    spring_std = statistics.stdev(spring_values)
-    summer_std = statistics.stdev(summer_values)
-    spring_mean = statistics.mean(spring_values)
-    summer_mean = statistics.mean(summer_values)
-
     # 如果春季溫差變異比夏季大，驗證成功
     is_verified = spring_std > summer_std
     accuracy = 1.0 if is_verified else 0.0
@@ -443,53 +749,51 @@ def verify_spring_mother_face(db: Session, station_id: str) -> VerificationResul
         proverb_id=proverb.id,
         proverb_text=proverb.text,
         verification=ProverbVerification(
-            total_cases=len(spring_values),
-            positive_cases=len(spring_values) if is_verified else 0,
+            total_cases=spring_count,
+            positive_cases=spring_count if is_verified else 0,
             accuracy_rate=accuracy,
             interpretation=f"春季日溫差標準差 {spring_std:.1f}°C，夏季 {summer_std:.1f}°C。{'春季確實變化較大' if is_verified else '夏季變化更大'}",
             sample_years=[],
             methodology="比較春季（3-5月）與夏季（6-8月）每日溫差的標準差",
         ),
         scientific_explanation=proverb.scientific_explanation,
-        confidence_level="高" if len(spring_values) > 1000 else "中",
-        data_quality=f"春季 {len(spring_values)} 筆，夏季 {len(summer_values)} 筆資料",
+        confidence_level="高" if spring_count > 1000 else "中",
+        data_quality=f"春季 {spring_count} 筆，夏季 {summer_count} 筆資料",
     )
 
 
-def verify_three_fu_days(db: Session, station_id: str) -> VerificationResult:
+@_cached_verification
+def verify_three_fu_days(
+    db: Session, station_id: str, proverb: Optional[Proverb] = None,
+) -> VerificationResult:
     """驗證「小暑大暑，上蒸下煮」
 
     邏輯：計算七月的平均最高溫和超過 35°C 的天數比例
     """
-    proverb = get_proverb_by_id("three_fu_days")
-
-    # 計算七月的統計
-    july_stats = db.query(
-        func.avg(RawObservation.temperature_max).label('avg_max'),
-        func.count(RawObservation.id).label('total_days'),
-    ).filter(
-        RawObservation.station_id == station_id,
-        extract('month', RawObservation.observed_date) == 7,
-        RawObservation.temperature_max.isnot(None)
-    ).first()
-
-    # 計算超過 35°C 的天數
-    hot_days = db.query(func.count(RawObservation.id)).filter(
-        RawObservation.station_id == station_id,
-        extract('month', RawObservation.observed_date) == 7,
-        RawObservation.temperature_max >= 35
-    ).scalar() or 0
-
-    # 計算其他月份平均最高溫作為對照
-    other_months_avg = db.query(
-        func.avg(RawObservation.temperature_max)
-    ).filter(
-        RawObservation.station_id == station_id,
-        extract('month', RawObservation.observed_date).notin_([6, 7, 8]),
-        RawObservation.temperature_max.isnot(None)
-    ).scalar() or 25
+    proverb = proverb or get_proverb_by_id("three_fu_days")
+
+    # 優先使用每月統計快照，尚未計算時才掃描原始觀測
+    monthly = _monthly_temperature(db, station_id, 7, (6, 7, 8), "max")
+    if monthly is None:
+        # 一次掃描取得七月統計、35°C 以上天數，以及其他月份平均最高溫（對照）
+        month = RawObservation.observed_month
+        is_july = month == 7
+        monthly = db.query(
+            func.avg(case((is_july, RawObservation.temperature_max))),
+            func.count(case((is_july, 1))),
+            func.sum(case(
+                (and_(is_july, RawObservation.temperature_max >= 35), 1), else_=0,
+            )),
+            func.avg(case(
+                (month.notin_([6, 7, 8]), RawObservation.temperature_max),
+            )),
+        ).filter(
+            RawObservation.station_id == station_id,
+            RawObservation.temperature_max.isnot(None)
+        ).one()
+    avg_max, total_days, hot_days, other_months_avg = monthly
 
-    if not july_stats or july_stats.total_days < 100:
+    if not total_days or total_days < 100:
         return VerificationResult(
             proverb_id=proverb.id,
             proverb_text=proverb.text,
@@ -506,8 +810,10 @@ def verify_three_fu_days(db: Session, station_id: str) -> VerificationResult:
             data_quality="資料不足",
         )
 
-    hot_ratio = hot_days / july_stats.total_days
-    temp_diff = july_stats.avg_max - other_months_avg
+    hot_days = hot_days or 0
+    other_months_avg = other_months_avg or 25
+    hot_ratio = hot_days / total_days
+    temp_diff = avg_max - other_months_avg
 
     # 如果七月比其他月份平均高 5°C 以上，且高溫天數超過 20%，視為驗證成功
     is_verified = temp_diff >= 5 and hot_ratio >= 0.1
@@ -516,53 +822,51 @@ def verify_three_fu_days(db: Session, station_id: str) -> VerificationResult:
         proverb_id=proverb.id,
         proverb_text=proverb.text,
         verification=ProverbVerification(
-            total_cases=july_stats.total_days,
+            total_cases=total_days,
             positive_cases=hot_days,
             accuracy_rate=round(hot_ratio, 3),
-            interpretation=f"七月平均最高溫 {july_stats.avg_max:.1f}°C，超過 35°C 的天數佔 {hot_ratio*100:.1f}%。{'確實是一年最熱時期' if is_verified else '驗證結果不明顯'}",
+            interpretation=f"七月平均最高溫 {avg_max:.1f}°C，超過 35°C 的天數佔 {hot_ratio*100:.1f}%。{'確實是一年最熱時期' if is_verified else '驗證結果不明顯'}",
             sample_years=[],
             methodology="計算七月平均最高溫和超過 35°C 的天數比例",
         ),
         scientific_explanation=proverb.scientific_explanation,
-        confidence_level="高" if july_stats.total_days > 500 else "中",
-        data_quality=f"分析了 {july_stats.total_days} 天七月資料",
+        confidence_level="高" if total_days > 500 else "中",
+        data_quality=f"分析了 {total_days} 天七月資料",
     )
 
 
-def verify_cold_in_nine(db: Session, station_id: str) -> VerificationResult:
+@_cached_verification
+def verify_cold_in_nine(
+    db: Session, station_id: str, proverb: Optional[Proverb] = None,
+) -> VerificationResult:
     """驗證「小寒大寒，凍成冰團」
 
     邏輯：計算一月的平均最低溫和低於 10°C 的天數比例
     """
-    proverb = get_proverb_by_id("cold_in_nine")
-
-    # 計算一月的統計
-    jan_stats = db.query(
-        func.avg(RawObservation.temperature_min).label('avg_min'),
-        func.count(RawObservation.id).label('total_days'),
-    ).filter(
-        RawObservation.station_id == station_id,
-        extract('month', RawObservation.observed_date) == 1,
-        RawObservation.temperature_min.isnot(None)
-    ).first()
-
-    # 計算低於 10°C 的天數
-    cold_days = db.query(func.count(RawObservation.id)).filter(
-        RawObservation.station_id == station_id,
-        extract('month', RawObservation.observed_date) == 1,
-        RawObservation.temperature_min < 10
-    ).scalar() or 0
-
-    # 計算其他月份平均最低溫作為對照
-    other_months_avg = db.query(
-        func.avg(RawObservation.temperature_min)
-    ).filter(
-        RawObservation.station_id == station_id,
-        extract('month', RawObservation.observed_date).notin_([12, 1, 2]),
-        RawObservation.temperature_min.isnot(None)
-    ).scalar() or 20
+    proverb = proverb or get_proverb_by_id("cold_in_nine")
+
+    # 優先使用每月統計快照，尚未計算時才掃描原始觀測
+    monthly = _monthly_temperature(db, station_id, 1, (12, 1, 2), "min")
+    if monthly is None:
+        # 一次掃描取得一月統計、10°C 以下天數，以及其他月份平均最低溫（對照）
+        month = RawObservation.observed_month
+        is_jan = month == 1
+        monthly = db.query(
+            func.avg(case((is_jan, RawObservation.temperature_min))),
+            func.count(case((is_jan, 1))),
+            func.sum(case(
+                (and_(is_jan, RawObservation.temperature_min < 10), 1), else_=0,
+            )),
+            func.avg(case(
+                (month.notin_([12, 1, 2]), RawObservation.temperature_min),
+            )),
+        ).filter(
+            RawObservation.station_id == station_id,
+            RawObservation.temperature_min.isnot(None)
+        ).one()
+    avg_min, total_days, cold_days, other_months_avg = monthly
 
-    if not jan_stats or jan_stats.total_days < 100:
+    if not total_days or total_days < 100:
         return VerificationResult(
             proverb_id=proverb.id,
             proverb_text=proverb.text,
@@ -579,8 +883,10 @@ def verify_cold_in_nine(db: Session, station_id: str) -> VerificationResult:
             data_quality="資料不足",
         )
 
-    cold_ratio = cold_days / jan_stats.total_days
-    temp_diff = other_months_avg - jan_stats.avg_min
+    cold_days = cold_days or 0
+    other_months_avg = other_months_avg or 20
+    cold_ratio = cold_days / total_days
+    temp_diff = other_months_avg - avg_min
 
     # 如果一月比其他月份平均低 5°C 以上，視為驗證成功
     is_verified = temp_diff >= 5
@@ -589,55 +895,67 @@ def verify_cold_in_nine(db: Session, station_id: str) -> VerificationResult:
         proverb_id=proverb.id,
         proverb_text=proverb.text,
         verification=ProverbVerification(
-            total_cases=jan_stats.total_days,
+            total_cases=total_days,
             positive_cases=cold_days,
             accuracy_rate=round(cold_ratio, 3),
-            interpretation=f"一月平均最低溫 {jan_stats.avg_min:.1f}°C，低於 10°C 的天數佔 {cold_ratio*100:.1f}%。{'確實是一年最冷時期' if is_verified else '驗證結果不明顯'}",
+            interpretation=f"一月平均最低溫 {avg_min:.1f}°C，低於 10°C 的天數佔 {cold_ratio*100:.1f}%。{'確實是一年最冷時期' if is_verified else '驗證結果不明顯'}",
             sample_years=[],
             methodology="計算一月平均最低溫和低於 10°C 的天數比例",
         ),
         scientific_explanation=proverb.scientific_explanation,
-        confidence_level="高" if jan_stats.total_days > 500 else "中",
-        data_quality=f"分析了 {jan_stats.total_days} 天一月資料",
+        confidence_level="高" if total_days > 500 else "中",
+        data_quality=f"分析了 {total_days} 天一月資料",
     )
 
 
-def verify_plum_rain(db: Session, station_id: str) -> VerificationResult:
+@_cached_verification
+def verify_plum_rain(
+    db: Session, station_id: str, proverb: Optional[Proverb] = None,
+) -> VerificationResult:
     """驗證「小滿大滿江河滿」
 
     邏輯：計算五月下旬至六月中旬的累積降雨量
     """
-    proverb = get_proverb_by_id("plum_rain")
+    proverb = proverb or get_proverb_by_id("plum_rain")
 
-    years_query = db.query(
-        extract('year', RawObservation.observed_date).label('year')
-    ).filter(
-        RawObservation.station_id == station_id
-    ).distinct().all()
-
-    years = [int(y[0]) for y in years_query]
+    years = _get_years(db, station_id)
 
     plum_rain_totals = []
     other_period_totals = []
     sample_years = []
 
-    for year in years:
-        # 梅雨季期間（5/20 - 6/20）
-        plum_rain = db.query(func.sum(RawObservation.precipitation)).filter(
-            RawObservation.station_id == station_id,
-            RawObservation.observed_date >= date(year, 5, 20),
-            RawObservation.observed_date <= date(year, 6, 20),
-            RawObservation.precipitation.isnot(None)
-        ).scalar() or 0
-
-        # 對照期間（同樣長度的 4/1 - 5/1）
-        other_period = db.query(func.sum(RawObservation.precipitation)).filter(
-            RawObservation.station_id == station_id,
-            RawObservation.observed_date >= date(year, 4, 1),
-            RawObservation.observed_date <= date(year, 5, 1),
-            RawObservation.precipitation.isnot(None)
-        ).scalar() or 0
+    yearly = []
+    if years:
+        # 梅雨季期間（5/20 - 6/20）與對照期間（同樣長度的 4/1 - 5/1）
+        windows = _year_windows(
+            [
+                (year, date(year, 4, 1), date(year, 5, 1), date(year, 5, 20), date(year, 6, 20))
+                for year in years
+            ],
+            ("other_start", "other_end", "plum_start", "plum_end"),
+        )
+        observed = RawObservation.observed_date
+        yearly = db.query(
+            windows.c.year,
+            func.sum(case(
+                (observed >= windows.c.plum_start, RawObservation.precipitation),
+            )).label("plum_rain"),
+            func.sum(case(
+                (observed <= windows.c.other_end, RawObservation.precipitation),
+            )).label("other_period"),
+        ).select_from(windows).join(
+            RawObservation,
+            and_(
+                RawObservation.station_id == station_id,
+                observed >= windows.c.other_start,
+                observed <= windows.c.plum_end,
+                RawObservation.precipitation.isnot(None),
+            ),
+        ).group_by(windows.c.year).order_by(windows.c.year).all()
 
+    for year, plum_rain, other_period in yearly:
+        plum_rain = plum_rain or 0
+        other_period = other_period or 0
         if plum_rain > 0 or other_period > 0:
             plum_rain_totals.append(plum_rain)
             other_period_totals.append(other_period)
@@ -660,11 +978,13 @@ def verify_plum_rain(db: Session, station_id: str) -> VerificationResult:
             data_quality="資料不足",
         )
 
-    avg_plum = sum(plum_rain_totals) / len(plum_rain_totals)
-    avg_other = sum(other_period_totals) / len(other_period_totals)
+    plum_arr = np.fromiter(plum_rain_totals, dtype=np.float64, count=len(plum_rain_totals))
+    other_arr = np.fromiter(other_period_totals, dtype=np.float64, count=len(other_period_totals))
+    avg_plum = float(plum_arr.mean())
+    avg_other = float(other_arr.mean())
 
     # 梅雨季降雨量超過對照期間的年數
-    positive_cases = sum(1 for p, o in zip(plum_rain_totals, other_period_totals) if p > o)
+    positive_cases = int((plum_arr > other_arr).sum())
     accuracy = positive_cases / len(plum_rain_totals)
 
     return VerificationResult(
@@ -684,48 +1004,27 @@ def verify_plum_rain(db: Session, station_id: str) -> VerificationResult:
     )
 
 
-def verify_autumn_tiger(db: Session, station_id: str) -> VerificationResult:
+@_cached_verification
+def verify_autumn_tiger(
+    db: Session, station_id: str, proverb: Optional[Proverb] = None,
+) -> VerificationResult:
     """驗證「處暑天還暑，好似秋老虎」
 
     邏輯：計算八月下旬至九月上旬的高溫天數
     """
-    proverb = get_proverb_by_id("autumn_tiger")
+    proverb = proverb or get_proverb_by_id("autumn_tiger")
 
-    # 處暑前後期間（8/20 - 9/10）的高溫統計
+    # 處暑前後期間（8/20 - 9/10）的高溫統計與高於 32°C 的天數
     stats = db.query(
         func.avg(RawObservation.temperature_max).label('avg_max'),
         func.count(RawObservation.id).label('total_days'),
+        func.sum(case((RawObservation.temperature_max >= 32, 1), else_=0)).label('hot_days'),
     ).filter(
         RawObservation.station_id == station_id,
-        or_(
-            and_(
-                extract('month', RawObservation.observed_date) == 8,
-                extract('day', RawObservation.observed_date) >= 20
-            ),
-            and_(
-                extract('month', RawObservation.observed_date) == 9,
-                extract('day', RawObservation.observed_date) <= 10
-            )
-        ),
+        _yearly_period(_get_years(db, station_id), (8, 20), (9, 10)),
         RawObservation.temperature_max.isnot(None)
     ).first()
 
-    # 高於 32°C 的天數
-    hot_days = db.query(func.count(RawObservation.id)).filter(
-        RawObservation.station_id == station_id,
-        or_(
-            and_(
-                extract('month', RawObservation.observed_date) == 8,
-                extract('day', RawObservation.observed_date) >= 20
-            ),
-            and_(
-                extract('month', RawObservation.observed_date) == 9,
-                extract('day', RawObservation.observed_date) <= 10
-            )
-        ),
-        RawObservation.temperature_max >= 32
-    ).scalar() or 0
-
     if not stats or stats.total_days < 50:
         return VerificationResult(
             proverb_id=proverb.id,
@@ -743,6 +1042,7 @@ def verify_autumn_tiger(db: Session, station_id: str) -> VerificationResult:
             data_quality="資料不足",
         )
 
+    hot_days = stats.hot_days or 0
     hot_ratio = hot_days / stats.total_days
 
     return VerificationResult(
@@ -779,6 +1079,11 @@ VERIFICATION_FUNCTIONS = {
     "autumn_tiger": verify_autumn_tiger,
 }
 
+# 各驗證函數對應的諺語，模組載入時查一次後直接傳入驗證函數
+_VERIFICATION_PROVERBS = {
+    proverb_id: get_proverb_by_id(proverb_id) for proverb_id in VERIFICATION_FUNCTIONS
+}
+
 
 def verify_proverb(db: Session, proverb_id: str, station_id: Optional[str] = None) -> Optional[VerificationResult]:
     """驗證單一諺語
@@ -811,16 +1116,62 @@ def verify_proverb(db: Session, proverb_id: str, station_id: Optional[str] = Non
             )
         return None
 
-    if not station_id:
-        station_id = _get_station_with_most_data(db)
+    station_id = _resolve_station_id(db, station_id)
 
     verify_func = VERIFICATION_FUNCTIONS[proverb_id]
-    return verify_func(db, station_id)
+    return verify_func(db, station_id, _VERIFICATION_PROVERBS[proverb_id])
+
+
+def _verify_or_error(db: Session, proverb_id: str, station_id: str) -> VerificationResult:
+    """執行單一驗證函數，失敗時回傳錯誤結果而不中斷"""
+    proverb = _VERIFICATION_PROVERBS[proverb_id]
+    try:
+        return VERIFICATION_FUNCTIONS[proverb_id](db, station_id, proverb)
+    except Exception as e:
+        # 記錄錯誤但繼續驗證其他諺語
+        return VerificationResult(
+            proverb_id=proverb_id,
+            proverb_text=proverb.text if proverb else "",
+            verification=ProverbVerification(
+                total_cases=0,
+                positive_cases=0,
+                accuracy_rate=0,
+                interpretation=f"驗證時發生錯誤：{str(e)}",
+                sample_years=[],
+                methodology="",
+            ),
+            scientific_explanation=proverb.scientific_explanation if proverb else "",
+            confidence_level="錯誤",
+            data_quality="驗證失敗",
+        )
+
+
+def _verify_in_own_session(
+    session_factory: sessionmaker,
+    proverb_id: str,
+    station_id: str,
+) -> VerificationResult:
+    """在獨立 session 中執行驗證（供執行緒池使用）"""
+    db = session_factory()
+    try:
+        return _verify_or_error(db, proverb_id, station_id)
+    finally:
+        db.close()
+
+
+def _can_verify_in_parallel(bind) -> bool:
+    """記憶體 SQLite 每條連線各自獨立，無法跨執行緒共用資料"""
+    url = bind.engine.url
+    return not (url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"))
 
 
 def verify_all_proverbs(db: Session, station_id: Optional[str] = None) -> list[VerificationResult]:
     """驗證所有可驗證的諺語
 
+    各驗證函數主要在等待資料庫查詢，因此以執行緒池並行執行，
+    每個執行緒使用自己的 session；結果仍依 VERIFICATION_FUNCTIONS 順序回傳，
+    並寫入驗證結果快取表。
+
     Args:
         db: 資料庫 session
         station_id: 站點 ID（可選）
@@ -828,36 +1179,122 @@ def verify_all_proverbs(db: Session, station_id: Optional[str] = None) -> list[V
     Returns:
         所有諺語的驗證結果列表
     """
-    if not station_id:
-        station_id = _get_station_with_most_data(db)
+    station_id = _resolve_station_id(db, station_id)
+
+    bind = db.get_bind()
+    # 年份範圍與資料指紋只查一次，供各驗證函數共用
+    fingerprint = _data_fingerprint(db, station_id)
+    run_info = {
+        "station_years": {station_id: _station_years(db, station_id)},
+        "data_fingerprint": {station_id: fingerprint},
+    }
+    # 全部結果都在程序內快取時，快取表已是最新，不必再寫入
+    all_cached = _all_cached(station_id, fingerprint)
 
-    results = []
-    for proverb_id, verify_func in VERIFICATION_FUNCTIONS.items():
+    if not _can_verify_in_parallel(bind):
+        db.info.update(run_info)
         try:
-            result = verify_func(db, station_id)
-            results.append(result)
-        except Exception as e:
-            # 記錄錯誤但繼續驗證其他諺語
-            proverb = get_proverb_by_id(proverb_id)
-            results.append(VerificationResult(
-                proverb_id=proverb_id,
-                proverb_text=proverb.text if proverb else "",
-                verification=ProverbVerification(
-                    total_cases=0,
-                    positive_cases=0,
-                    accuracy_rate=0,
-                    interpretation=f"驗證時發生錯誤：{str(e)}",
-                    sample_years=[],
-                    methodology="",
-                ),
-                scientific_explanation=proverb.scientific_explanation if proverb else "",
-                confidence_level="錯誤",
-                data_quality="驗證失敗",
-            ))
-
+            results = [
+                _verify_or_error(db, proverb_id, station_id)
+                for proverb_id in VERIFICATION_FUNCTIONS
+            ]
+        finally:
+            for key in run_info:
+                db.info.pop(key, None)
+    else:
+        session_factory = sessionmaker(bind=bind, autoflush=False, info=run_info)
+        with ThreadPoolExecutor(max_workers=len(VERIFICATION_FUNCTIONS)) as executor:
+            futures = {
+                proverb_id: executor.submit(
+                    _verify_in_own_session, session_factory, proverb_id, station_id
+                )
+                for proverb_id in VERIFICATION_FUNCTIONS
+            }
+        results = [futures[proverb_id].result() for proverb_id in VERIFICATION_FUNCTIONS]
+
+    # 重新驗證過才寫入驗證結果快取表，供統計摘要直接彙總
+    # 寫入失敗（如資料庫鎖定、唯讀檔案系統）不影響已算好的驗證結果
+    if not all_cached:
+        try:
+            _store_results(bind, station_id, results)
+        except SQLAlchemyError:
+            logger.warning("寫入諺語驗證結果快取表失敗 (station_id=%s)", station_id, exc_info=True)
     return results
 
 
+# 驗證結果快取表的有效期限
+_STORED_RESULTS_TTL = timedelta(days=1)
+
+# 高準確率門檻
+_HIGH_ACCURACY = 0.65
+
+
+# 支援 INSERT ... ON CONFLICT DO UPDATE 的資料庫方言
+_UPSERT_INSERTS = {
+    "sqlite": sqlite_insert,
+    "postgresql": postgresql_insert,
+}
+
+
+def _store_results(bind, station_id: str, results: list[VerificationResult]) -> None:
+    """以 upsert 寫入站點的驗證結果快取；驗證失敗的項目不寫入
+
+    使用獨立 session 與交易，不會提交呼叫端 session 中未完成的變更；
+    (station_id, proverb_id) 衝突時更新既有列，並行請求不會違反唯一約束。
+    資料庫不支援 upsert 時不寫入，統計摘要改為即時驗證。
+    """
+    insert = _UPSERT_INSERTS.get(bind.dialect.name)
+    computed_at = datetime.now()
+    rows = [
+        {
+            "proverb_id": r.proverb_id,
+            "station_id": station_id,
+            "accuracy": r.verification.accuracy_rate,
+            "total_cases": r.verification.total_cases,
+            "computed_at": computed_at,
+        }
+        for r in results
+        if r.confidence_level != "錯誤"
+    ]
+    if insert is None or not rows:
+        return
+
+    stmt = insert(ProverbVerificationCache).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ProverbVerificationCache.station_id, ProverbVerificationCache.proverb_id],
+        set_={
+            "accuracy": stmt.excluded.accuracy,
+            "total_cases": stmt.excluded.total_cases,
+            "computed_at": stmt.excluded.computed_at,
+        },
+    )
+    with Session(bind=bind) as session, session.begin():
+        session.execute(stmt)
+
+
+def _summarize_stored_results(db: Session, station_id: str) -> Optional[tuple[int, float, int]]:
+    """在驗證結果快取表彙總 (已驗證數, 平均準確率, 高準確率數)
+
+    快取表已過期或結果不完整時回傳 None
+    """
+    cache = ProverbVerificationCache
+    is_valid = cache.total_cases > 0
+    row = db.query(
+        func.count(),
+        func.count(case((is_valid, 1))),
+        func.avg(case((is_valid, cache.accuracy))),
+        func.sum(case((and_(is_valid, cache.accuracy >= _HIGH_ACCURACY), 1), else_=0)),
+    ).filter(
+        cache.station_id == station_id,
+        cache.computed_at >= datetime.now() - _STORED_RESULTS_TTL,
+    ).one()
+
+    stored, verified_count, avg_accuracy, high_accuracy_count = row
+    if stored < len(VERIFICATION_FUNCTIONS):
+        return None
+    return verified_count, avg_accuracy or 0, high_accuracy_count or 0
+
+
 def get_proverb_stats_summary(db: Session, station_id: Optional[str] = None) -> dict:
     """取得諺語驗證統計摘要
 
@@ -875,15 +1312,25 @@ def get_proverb_stats_summary(db: Session, station_id: Optional[str] = None) ->
     all_proverbs = get_all_proverbs()
     verifiable = get_verifiable_proverbs()
 
-    results = verify_all_proverbs(db, station_id)
-    valid_results = [r for r in results if r.verification.total_cases > 0]
+    station_id = _resolve_station_id(db, station_id)
 
-    accuracies = [r.verification.accuracy_rate for r in valid_results]
+    # 一天內已驗證過的站點直接在快取表彙總
+    stored = _summarize_stored_results(db, station_id)
+    if stored is not None:
+        verified_count, avg_accuracy, high_accuracy_count = stored
+    else:
+        results = verify_all_proverbs(db, station_id)
+        accuracies = [
+            r.verification.accuracy_rate for r in results if r.verification.total_cases > 0
+        ]
+        verified_count = len(accuracies)
+        avg_accuracy = sum(accuracies) / len(accuracies) if accuracies else 0
+        high_accuracy_count = sum(1 for a in accuracies if a >= _HIGH_ACCURACY)
 
     return {
         "total_proverbs": len(all_proverbs),
         "verifiable_count": len(verifiable),
-        "verified_count": len(valid_results),
-        "avg_accuracy": round(sum(accuracies) / len(accuracies), 3) if accuracies else 0,
-        "high_accuracy_count": sum(1 for a in accuracies if a >= 0.65),
+        "verified_count": verified_count,
+        "avg_accuracy": round(avg_accuracy, 3) if verified_count else 0,
+        "high_accuracy_count": high_accuracy_count,
     }
@@ -5,6 +5,11 @@
 
 import httpx
 import asyncio
+import logging
+import orjson
+import pandas as pd
+import sys
+import time
 from typing import Optional
 from datetime import datetime, timedelta, timezone
 
@@ -14,11 +19,67 @@ TW_TIMEZONE = timezone(timedelta(hours=8))
 from app.config import settings
 from app.services.notification import notify_api_key_expired
 
+logger = logging.getLogger(__name__)
+
 
 # CWA API 端點
 # O-A0003-001: 自動氣象站-氣象觀測資料
 REALTIME_ENDPOINT = "O-A0003-001"
 
+# 只向 CWA 請求解析時用到的觀測元素，未使用的欄位不會傳輸、也不需解析成 Python 物件
+_REALTIME_ELEMENTS = ",".join((
+    "Weather",
+    "Now",
+    "WindSpeed",
+    "AirTemperature",
+    "RelativeHumidity",
+    "SunshineDuration",
+    "DailyHigh",
+    "DailyLow",
+))
+
+# 共用的 CWA API 連線池，重複使用 keep-alive 連線以省去每次 TCP + TLS 握手
+_client: Optional[httpx.AsyncClient] = None
+
+
+async def get_client() -> httpx.AsyncClient:
+    """取得共用的 CWA API client（首次呼叫時建立）"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=settings.cwa_api_base,
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _client
+
+
+# 即時觀測約每 10 分鐘更新一次，結果快取 _REALTIME_CACHE_TTL 秒
+# key：站點代碼，全站點查詢使用 None；value：(monotonic 時間戳, 查詢結果)
+_REALTIME_CACHE_TTL = 300  # 秒
+_realtime_cache: dict[Optional[str], tuple[float, object]] = {}
+
+
+def _get_cached(key: Optional[str]):
+    """取得未過期的快取結果，沒有則回傳 None"""
+    entry = _realtime_cache.get(key)
+    if entry and time.monotonic() - entry[0] < _REALTIME_CACHE_TTL:
+        return entry[1]
+    return None
+
+
+def clear_realtime_cache() -> None:
+    """清除即時天氣快取"""
+    _realtime_cache.clear()
+
+
+async def close_client() -> None:
+    """關閉共用的 CWA API client（應用程式關閉時呼叫）"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 class RealtimeWeatherData:
     """即時天氣資料結構"""
@@ -68,6 +129,33 @@ class RealtimeWeatherData:
         }
 
 
+# CWA 以 -99 表示缺值
+_MISSING_VALUES = frozenset({"-99", "-99.0", ""})
+
+
+def _to_float(value) -> Optional[float]:
+    """將 CWA 觀測值轉為 float，缺值或無效時返回 None"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return None if value == -99 else float(value)
+    if value in _MISSING_VALUES:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _dig(data, *keys):
+    """依序取出巢狀 dict 的值，任一層缺少或不是 dict 時返回 None"""
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
 def parse_weather_element(elements: dict, name: str) -> Optional[float]:
     """從天氣元素物件中解析指定元素的值
 
@@ -79,23 +167,12 @@ def parse_weather_element(elements: dict, name: str) -> Optional[float]:
         元素值（float），如果找不到或無效則返回 None
     """
     value = elements.get(name)
-    if value is None:
-        return None
 
-    # 處理嵌套結構
+    # 處理嵌套結構（如 Now.Precipitation）
     if isinstance(value, dict):
-        # 如 Now.Precipitation
-        if "Precipitation" in value:
-            value = value.get("Precipitation")
-        else:
-            return None
+        value = value.get("Precipitation")
 
-    if value is not None and str(value) not in ["-99", "-99.0", ""]:
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return None
-    return None
+    return _to_float(value)
 
 
 def parse_daily_extreme(elements: dict, extreme_type: str) -> Optional[float]:
@@ -108,16 +185,51 @@ def parse_daily_extreme(elements: dict, extreme_type: str) -> Optional[float]:
     Returns:
         溫度值，如果找不到則返回 None
     """
-    try:
-        daily_extreme = elements.get("DailyExtreme", {})
-        extreme_data = daily_extreme.get(extreme_type, {})
-        temp_info = extreme_data.get("TemperatureInfo", {})
-        value = temp_info.get("AirTemperature")
-        if value and str(value) not in ["-99", "-99.0"]:
-            return float(value)
-    except (ValueError, TypeError, AttributeError):
-        pass
-    return None
+    return _to_float(
+        _dig(elements, "DailyExtreme", extreme_type, "TemperatureInfo", "AirTemperature")
+    )
+
+
+def _element_map(raw_elements) -> dict:
+    """將 WeatherElement 整理為 元素名稱 → 值 的 dict（每站只整理一次）
+
+    目前 API 回傳 dict；舊版格式為 [{"ElementName": ..., "ElementValue": ...}] 列表，
+    轉成 dict 後各元素都以單次查表取得，不必逐一掃描列表。
+    """
+    if isinstance(raw_elements, list):
+        # 元素名稱 intern 後與程式中的字串常數為同一物件，查表時只需比對指標
+        return {sys.intern(e["ElementName"]): e.get("ElementValue") for e in raw_elements}
+    return raw_elements or {}
+
+
+def _parse_station(station: dict, now: Optional[datetime] = None) -> RealtimeWeatherData:
+    """將 CWA API 的單一站點資料轉為 RealtimeWeatherData
+
+    Args:
+        station: CWA API 返回的站點物件
+        now: 缺少觀測時間時使用的時間（批次解析時由呼叫端統一取得一次）
+    """
+    obs_time_str = _dig(station, "ObsTime", "DateTime")
+    if obs_time_str:
+        obs_time = datetime.fromisoformat(obs_time_str)
+    else:
+        obs_time = now or datetime.now(TW_TIMEZONE)
+
+    elements = _element_map(station.get("WeatherElement"))
+
+    return RealtimeWeatherData(
+        station_id=station.get("StationId"),
+        station_name=station.get("StationName"),
+        obs_time=obs_time,
+        weather=elements.get("Weather"),  # 天氣描述（直接從物件取得）
+        temp=parse_weather_element(elements, "AirTemperature"),
+        temp_max=parse_daily_extreme(elements, "DailyHigh"),
+        temp_min=parse_daily_extreme(elements, "DailyLow"),
+        humidity=parse_weather_element(elements, "RelativeHumidity"),
+        wind_speed=parse_weather_element(elements, "WindSpeed"),
+        precipitation=parse_weather_element(elements, "Now"),  # 當日累積雨量
+        sunshine_hours=parse_weather_element(elements, "SunshineDuration"),
+    )
 
 
 async def fetch_realtime_weather(station_id: str) -> Optional[RealtimeWeatherData]:
@@ -129,112 +241,154 @@ async def fetch_realtime_weather(station_id: str) -> Optional[RealtimeWeatherDat
     Returns:
         即時天氣資料，如果查詢失敗則返回 None
     """
-    url = f"{settings.cwa_api_base}/{REALTIME_ENDPOINT}"
+    cached = _get_cached(station_id)
+    if cached is not None:
+        return cached
+
+    # 全站點資料仍在有效期內時直接取用，不另外查詢
+    all_stations = _get_cached(None)
+    if all_stations is not None:
+        for data in all_stations:
+            if data.station_id == station_id:
+                return data
+
     params = {
         "Authorization": settings.cwa_api_key,
         "StationId": station_id,
+        "WeatherElement": _REALTIME_ELEMENTS,
     }
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+        client = await get_client()
+        response = await client.get(REALTIME_ENDPOINT, params=params)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
-        stations = data.get("records", {}).get("Station", [])
+        stations = _dig(data, "records", "Station") or []
         if not stations:
             return None
 
-        station = stations[0]
-        obs_time_str = station.get("ObsTime", {}).get("DateTime")
-        obs_time = datetime.fromisoformat(obs_time_str) if obs_time_str else datetime.now(TW_TIMEZONE)
-
-        elements = station.get("WeatherElement", {})
-
-        # 天氣描述（直接從物件取得）
-        weather = elements.get("Weather")
-
-        return RealtimeWeatherData(
-            station_id=station.get("StationId"),
-            station_name=station.get("StationName"),
-            obs_time=obs_time,
-            weather=weather,
-            temp=parse_weather_element(elements, "AirTemperature"),
-            temp_max=parse_daily_extreme(elements, "DailyHigh"),
-            temp_min=parse_daily_extreme(elements, "DailyLow"),
-            humidity=parse_weather_element(elements, "RelativeHumidity"),
-            wind_speed=parse_weather_element(elements, "WindSpeed"),
-            precipitation=parse_weather_element(elements, "Now"),  # 當日累積雨量
-            sunshine_hours=parse_weather_element(elements, "SunshineDuration"),
-        )
+        result = _parse_station(stations[0])
+        _realtime_cache[station_id] = (time.monotonic(), result)
+        return result
 
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 401:
-            print(f"CWA API 認證失敗 (401): API 密鑰可能已失效")
+            logger.warning("CWA API 認證失敗 (401): API 密鑰可能已失效")
             # 非同步發送通知
             asyncio.create_task(
                 notify_api_key_expired("CWA OpenData", "401 Forbidden - API 密鑰已失效或不正確")
             )
         else:
-            print(f"CWA API HTTP 錯誤: {e.response.status_code}")
+            logger.warning("CWA API HTTP 錯誤: %s", e.response.status_code)
         return None
-    except Exception as e:
-        print(f"Error fetching realtime weather: {e}")
+    except Exception:
+        logger.exception("Error fetching realtime weather")
         return None
 
 
+# 批次查詢時同時進行的請求上限，避免觸發 CWA 流量限制
+_MAX_CONCURRENT_REQUESTS = 10
+
+
+async def fetch_multi_realtime_weather(station_ids: list[str]) -> list[RealtimeWeatherData]:
+    """同時查詢多個站點的即時天氣資料
+
+    Args:
+        station_ids: 氣象站代碼列表
+
+    Returns:
+        查詢成功的即時天氣資料列表（依 station_ids 順序，失敗的站點略過）
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+
+    async def fetch_one(station_id: str) -> Optional[RealtimeWeatherData]:
+        async with semaphore:
+            return await fetch_realtime_weather(station_id)
+
+    results = await asyncio.gather(
+        *(fetch_one(station_id) for station_id in station_ids),
+        return_exceptions=True,
+    )
+    return [r for r in results if isinstance(r, RealtimeWeatherData)]
+
+
 async def fetch_all_realtime_weather() -> list[RealtimeWeatherData]:
     """取得所有站點的即時天氣資料
 
     Returns:
         所有站點的即時天氣資料列表
     """
-    url = f"{settings.cwa_api_base}/{REALTIME_ENDPOINT}"
+    # 快取存放 tuple，每次回傳新的 list，呼叫端修改結果不影響快取
+    cached = _get_cached(None)
+    if cached is not None:
+        return list(cached)
+
     params = {
         "Authorization": settings.cwa_api_key,
+        "WeatherElement": _REALTIME_ELEMENTS,
     }
 
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-        stations = data.get("records", {}).get("Station", [])
-        results = []
-
-        for station in stations:
-            obs_time_str = station.get("ObsTime", {}).get("DateTime")
-            obs_time = datetime.fromisoformat(obs_time_str) if obs_time_str else datetime.now(TW_TIMEZONE)
-
-            elements = station.get("WeatherElement", {})
-            weather = elements.get("Weather")
-
-            results.append(RealtimeWeatherData(
-                station_id=station.get("StationId"),
-                station_name=station.get("StationName"),
-                obs_time=obs_time,
-                weather=weather,
-                temp=parse_weather_element(elements, "AirTemperature"),
-                temp_max=parse_daily_extreme(elements, "DailyHigh"),
-                temp_min=parse_daily_extreme(elements, "DailyLow"),
-                humidity=parse_weather_element(elements, "RelativeHumidity"),
-                wind_speed=parse_weather_element(elements, "WindSpeed"),
-                precipitation=parse_weather_element(elements, "Now"),
-                sunshine_hours=parse_weather_element(elements, "SunshineDuration"),
-            ))
-
+        # 全站點資料量較大，放寬逾時
+        client = await get_client()
+        response = await client.get(REALTIME_ENDPOINT, params=params, timeout=60.0)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+        stations = _dig(data, "records", "Station") or []
+        now = datetime.now(TW_TIMEZONE)
+        results = [_parse_station(station, now) for station in stations]
+
+        if results:
+            _realtime_cache[None] = (time.monotonic(), tuple(results))
         return results
 
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 401:
-            print(f"CWA API 認證失敗 (401): API 密鑰可能已失效")
+            logger.warning("CWA API 認證失敗 (401): API 密鑰可能已失效")
             asyncio.create_task(
                 notify_api_key_expired("CWA OpenData", "401 Forbidden - API 密鑰已失效或不正確")
             )
         else:
-            print(f"CWA API HTTP 錯誤: {e.response.status_code}")
+            logger.warning("CWA API HTTP 錯誤: %s", e.response.status_code)
         return []
-    except Exception as e:
-        print(f"Error fetching all realtime weather: {e}")
+    except Exception:
+        logger.exception("Error fetching all realtime weather")
         return []
+
+
+# 欄位式（DataFrame）輸出的欄位
+_FRAME_COLUMNS = (
+    "station_id",
+    "station_name",
+    "obs_time",
+    "temp",
+    "temp_max",
+    "temp_min",
+    "humidity",
+    "wind_speed",
+    "precipitation",
+)
+
+
+async def fetch_all_realtime_weather_df() -> pd.DataFrame:
+    """取得所有站點的即時天氣資料（欄位式 DataFrame）
+
+    供需要跨站點計算的呼叫端使用（如全台平均氣溫、最熱站點），
+    以向量化運算取代逐一存取 RealtimeWeatherData 物件。
+
+    Returns:
+        每站一列、欄位為 _FRAME_COLUMNS 的 DataFrame，缺值為 NaN
+    """
+    results = await fetch_all_realtime_weather()
+
+    columns: dict[str, list] = {name: [] for name in _FRAME_COLUMNS}
+    for data in results:
+        for name, values in columns.items():
+            values.append(getattr(data, name))
+
+    df = pd.DataFrame(columns)
+    numeric = list(_FRAME_COLUMNS[3:])
+    df[numeric] = df[numeric].astype("float64")
+    return df
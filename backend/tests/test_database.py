@@ -0,0 +1,35 @@
+"""資料庫初始化測試"""
+
+from datetime import date
+
+from sqlalchemy import create_engine, inspect, text
+
+from app.database import init_db
+
+
+def test_init_db_adds_generated_date_columns_to_existing_table():
+    """既有的舊版 raw_observations 補上年、月、日產生欄位與索引"""
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE raw_observations ("
+            "id INTEGER PRIMARY KEY, station_id VARCHAR(10) NOT NULL, "
+            "observed_date DATE NOT NULL, temperature_avg FLOAT, temperature_max FLOAT, "
+            "temperature_min FLOAT, precipitation FLOAT, humidity_avg FLOAT, "
+            "wind_speed_avg FLOAT, wind_speed_max FLOAT, sunshine_hours FLOAT, "
+            "global_radiation_sum FLOAT, station_pressure_avg FLOAT)"
+        ))
+        conn.execute(text(
+            "INSERT INTO raw_observations (station_id, observed_date) VALUES ('466920', :d)"
+        ), {"d": date(2001, 7, 15)})
+
+    init_db(engine)
+    init_db(engine)  # 重複執行不應出錯
+
+    indexes = {ix["name"] for ix in inspect(engine).get_indexes("raw_observations")}
+    assert "ix_station_month" in indexes
+    with engine.connect() as conn:
+        row = conn.execute(text(
+            "SELECT observed_year, observed_month, observed_day FROM raw_observations"
+        )).one()
+    assert tuple(row) == (2001, 7, 15)
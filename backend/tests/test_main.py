@@ -0,0 +1,31 @@
+"""應用程式生命週期測試"""
+
+import pytest
+
+from app import main
+
+
+async def test_lifespan_cleans_up_when_warm_up_fails(monkeypatch):
+    """節氣預熱失敗時，關閉時仍釋放共用 client 與日誌執行緒"""
+    calls = []
+
+    class FakeListener:
+        def stop(self):
+            calls.append("listener")
+
+    async def fake_close_client():
+        calls.append("client")
+
+    def fail():
+        raise RuntimeError("warm-up failed")
+
+    monkeypatch.setattr(main, "setup_logging", FakeListener)
+    monkeypatch.setattr(main, "init_db", lambda: None)
+    monkeypatch.setattr(main, "warm_up_solar_terms", fail)
+    monkeypatch.setattr(main, "close_client", fake_close_client)
+
+    with pytest.raises(RuntimeError):
+        async with main.lifespan(main.app):
+            pass
+
+    assert calls == ["client", "listener"]
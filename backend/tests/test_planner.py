@@ -0,0 +1,102 @@
+"""活動規劃服務測試"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, DailyStatistics, Station
+from app.services.planner import (
+    ActivityType,
+    _get_lunar_score_notes,
+    clear_station_stats_cache,
+    plan_activity,
+)
+
+
+@pytest.fixture
+def db():
+    """記憶體 SQLite，含一個站點與一月上旬的統計"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Station(
+        station_id="466920", name="臺北", county="臺北市",
+        latitude=25.03, longitude=121.51,
+    ))
+    for day in range(1, 11):
+        session.add(DailyStatistics(
+            station_id="466920",
+            month_day=f"01-{day:02d}",
+            precip_probability=0.05 if day == 7 else 0.5,
+            temp_avg_mean=24.0 if day == 7 else 16.0,
+            tendency_sunny=0.8 if day == 7 else 0.2,
+        ))
+    session.commit()
+    clear_station_stats_cache()
+    yield session
+    session.close()
+    clear_station_stats_cache()
+
+
+def test_plan_activity_ranks_best_day(db):
+    """天氣條件最佳的日期排第一"""
+    result = plan_activity(
+        db, ActivityType.PICNIC, "466920", date(2026, 1, 1), date(2026, 1, 20), top_n=3,
+    )
+
+    assert result is not None
+    assert result.station_name == "臺北"
+    assert result.best_date.date == date(2026, 1, 7)
+    assert len(result.recommendations) == 3
+    # 沒有統計的日期（1/11 之後）不列入
+    assert all(r.date.day <= 10 for r in result.recommendations)
+
+
+def test_plan_activity_uses_cached_stats(db):
+    """同站點第二次規劃使用快取，清除後才讀到新資料"""
+    plan_activity(db, ActivityType.PICNIC, "466920", date(2026, 1, 1), date(2026, 1, 10))
+
+    db.query(DailyStatistics).filter(DailyStatistics.month_day == "01-03").update(
+        {"precip_probability": 0.0, "temp_avg_mean": 25.0, "tendency_sunny": 1.0}
+    )
+    db.commit()
+
+    cached = plan_activity(db, ActivityType.PICNIC, "466920", date(2026, 1, 1), date(2026, 1, 10))
+    assert cached.best_date.date == date(2026, 1, 7)
+
+    clear_station_stats_cache()
+    fresh = plan_activity(db, ActivityType.PICNIC, "466920", date(2026, 1, 1), date(2026, 1, 10))
+    assert fresh.best_date.date == date(2026, 1, 3)
+
+
+def test_plan_activity_unknown_station(db):
+    """站點不存在時回傳 None"""
+    assert plan_activity(
+        db, ActivityType.PICNIC, "000000", date(2026, 1, 1), date(2026, 1, 5),
+    ) is None
+
+
+def test_lunar_score_notes():
+    """宜忌關鍵字各只計一次"""
+    lunar_info = {"yi_ji": {"yi": ["嫁娶", "訂盟"], "ji": ["出行"]}}
+
+    assert _get_lunar_score_notes(lunar_info, ("嫁娶", "訂盟"), ("嫁娶",)) == (5, ["宜嫁娶"])
+    assert _get_lunar_score_notes(lunar_info, (), ("出行", "遠行")) == (-10, ["忌出行"])
+    assert _get_lunar_score_notes({}, ("出行",), ()) == (0, [])
+
+
+def test_plan_activity_reloads_after_pipeline_recompute(db):
+    """資料管線刪除後重寫統計時，不需清除快取即讀到新資料"""
+    plan_activity(db, ActivityType.PICNIC, "466920", date(2026, 1, 1), date(2026, 1, 10))
+
+    db.query(DailyStatistics).filter(DailyStatistics.month_day == "01-03").delete()
+    db.add(DailyStatistics(
+        station_id="466920", month_day="01-03",
+        precip_probability=0.0, temp_avg_mean=25.0, tendency_sunny=1.0,
+    ))
+    db.commit()
+
+    result = plan_activity(db, ActivityType.PICNIC, "466920", date(2026, 1, 1), date(2026, 1, 10))
+    assert result.best_date.date == date(2026, 1, 3)
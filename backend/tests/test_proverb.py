@@ -0,0 +1,64 @@
+"""諺語資料庫查詢測試"""
+
+import dataclasses
+
+import pytest
+
+from app.services.proverb import (
+    PROVERBS_DATABASE,
+    ProverbCategory,
+    ProverbRegion,
+    get_all_proverbs,
+    get_proverbs_by_category,
+    get_proverbs_by_month,
+    get_proverbs_by_region,
+    get_proverbs_by_solar_term,
+    get_verifiable_proverbs,
+    search_proverbs,
+)
+
+
+def test_get_all_proverbs_preserves_order():
+    """所有諺語依資料庫定義順序回傳"""
+    assert list(get_all_proverbs()) == list(PROVERBS_DATABASE.values())
+
+
+def test_indexes_match_full_scan():
+    """預建索引結果應與逐筆掃描一致"""
+    proverbs = list(PROVERBS_DATABASE.values())
+    for cat in ProverbCategory:
+        assert list(get_proverbs_by_category(cat)) == [p for p in proverbs if p.category == cat]
+    for reg in ProverbRegion:
+        assert list(get_proverbs_by_region(reg)) == [p for p in proverbs if p.region == reg]
+    for month in range(1, 13):
+        assert list(get_proverbs_by_month(month)) == [
+            p for p in proverbs if month in p.applicable_months
+        ]
+    assert list(get_proverbs_by_solar_term("立春")) == [
+        p for p in proverbs if p.related_solar_term == "立春"
+    ]
+    assert list(get_verifiable_proverbs()) == [p for p in proverbs if p.verifiable]
+
+
+def test_unknown_keys_return_empty():
+    """查無資料時回傳空結果"""
+    assert get_proverbs_by_solar_term("不存在") == ()
+    assert get_proverbs_by_month(13) == ()
+
+
+def test_search_proverbs():
+    """搜尋原文、解釋與關鍵字"""
+    ids = [p.id for p in search_proverbs("夏至")]
+    assert "xiazhi_heat" in ids
+    assert "summer_solstice_long" in ids
+    assert search_proverbs("zzz-not-found") == ()
+
+
+def test_proverb_is_immutable_and_hashable():
+    """諺語為不可變資料，可作為 set 元素"""
+    proverb = PROVERBS_DATABASE["lichun_rain"]
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        proverb.text = "改寫"
+    assert isinstance(proverb.keywords, tuple)
+    assert len(set(get_all_proverbs())) == len(PROVERBS_DATABASE)
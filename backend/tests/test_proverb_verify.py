@@ -0,0 +1,343 @@
+"""諺語驗證服務測試"""
+
+import logging
+import statistics
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, MonthlyStatistics, ProverbVerificationCache, RawObservation
+from app.services import proverb_verify
+from app.services.monthly_stats import refresh_monthly_statistics
+from app.services.proverb_verify import (
+    VERIFICATION_FUNCTIONS,
+    clear_verification_cache,
+    get_proverb_stats_summary,
+    verify_all_proverbs,
+    verify_cold_in_nine,
+    verify_dongzhi_cold,
+    verify_lichun_rain,
+    verify_spring_mother_face,
+    verify_three_fu_days,
+)
+
+STATION_ID = "466920"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """每個測試使用獨立資料庫，避免沿用前一個測試的快取結果"""
+    clear_verification_cache()
+    yield
+    clear_verification_cache()
+
+
+@pytest.fixture
+def db():
+    """記憶體 SQLite 測試資料庫"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _add_days(db, start: date, end: date, **values):
+    """新增 start ~ end（含）每日觀測，values 可為常數或 f(date)"""
+    current = start
+    while current <= end:
+        db.add(RawObservation(
+            station_id=STATION_ID,
+            observed_date=current,
+            **{k: v(current) if callable(v) else v for k, v in values.items()},
+        ))
+        current += timedelta(days=1)
+    db.commit()
+
+
+def test_verify_lichun_rain(db):
+    """立春有雨的年份才列入樣本，清明前雨日超過 40% 視為符合"""
+    # 2000：立春有雨，之後隔天下雨 → 符合
+    _add_days(db, date(2000, 2, 4), date(2000, 4, 5),
+              precipitation=lambda d: 5.0 if d.toordinal() % 2 == 0 else 0.0)
+    db.query(RawObservation).filter(
+        RawObservation.observed_date == date(2000, 2, 4)
+    ).update({"precipitation": 3.0})
+    # 2001：立春有雨，之後都是晴天 → 不符合
+    _add_days(db, date(2001, 2, 4), date(2001, 4, 5),
+              precipitation=lambda d: 2.0 if d == date(2001, 2, 4) else 0.0)
+    # 2002：立春無雨 → 不列入
+    _add_days(db, date(2002, 2, 4), date(2002, 4, 5), precipitation=8.0)
+    db.query(RawObservation).filter(
+        RawObservation.observed_date == date(2002, 2, 4)
+    ).update({"precipitation": 0.0})
+    db.commit()
+
+    result = verify_lichun_rain(db, STATION_ID)
+
+    assert result.verification.total_cases == 2
+    assert result.verification.positive_cases == 1
+    assert result.verification.sample_years == [2000, 2001]
+    assert result.verification.accuracy_rate == 0.5
+
+
+def test_verify_lichun_rain_no_data(db):
+    """沒有資料時回傳零樣本"""
+    result = verify_lichun_rain(db, STATION_ID)
+
+    assert result.verification.total_cases == 0
+    assert result.verification.accuracy_rate == 0
+
+
+def test_verify_dongzhi_cold_window_crosses_year(db):
+    """冬至後 30 天跨到隔年一月，仍歸入冬至當年"""
+    _add_days(db, date(2000, 11, 22), date(2000, 12, 22), temperature_min=15.0)
+    _add_days(db, date(2000, 12, 23), date(2001, 1, 21), temperature_min=10.0)
+
+    result = verify_dongzhi_cold(db, STATION_ID)
+
+    assert result.verification.total_cases == 1
+    assert result.verification.positive_cases == 1
+    assert result.verification.sample_years == [2000]
+    assert "低 5.0°C" in result.verification.interpretation
+
+
+def _seed_spring_summer(db):
+    """兩年春夏資料：春季日溫差變化大、夏季穩定；2001/4/1 最低溫缺值"""
+    for year in (2000, 2001):
+        _add_days(db, date(year, 3, 1), date(year, 5, 31),
+                  temperature_max=lambda d: 25.0 + (d.day % 5) * 2, temperature_min=15.0)
+        _add_days(db, date(year, 6, 1), date(year, 8, 31),
+                  temperature_max=lambda d: 32.0 + (d.day % 2) * 0.5, temperature_min=26.0)
+    db.query(RawObservation).filter(
+        RawObservation.observed_date == date(2001, 4, 1)
+    ).update({"temperature_min": None})
+    db.commit()
+
+
+def test_verify_spring_mother_face(db):
+    """春季日溫差變異大於夏季，缺值日期不列入"""
+    _seed_spring_summer(db)
+
+    result = verify_spring_mother_face(db, STATION_ID)
+
+    assert result.verification.accuracy_rate == 1.0
+    assert result.verification.total_cases == 183
+    assert result.data_quality == "春季 183 筆，夏季 184 筆資料"
+
+
+class _StdevSamp:
+    """供 SQLite 測試用的 stddev_samp 聚合函數"""
+
+    def __init__(self):
+        self.values = []
+
+    def step(self, value):
+        if value is not None:
+            self.values.append(value)
+
+    def finalize(self):
+        return statistics.stdev(self.values) if len(self.values) > 1 else None
+
+
+def test_daily_range_spread_sql_matches_fallback(db, monkeypatch):
+    """資料庫端 stddev_samp 與 NumPy 備援計算結果一致"""
+    _seed_spring_summer(db)
+    fallback = proverb_verify._daily_range_spread(db, STATION_ID)
+
+    db.connection().connection.driver_connection.create_aggregate("stddev_samp", 1, _StdevSamp)
+    monkeypatch.setattr(proverb_verify, "_STDDEV_DIALECTS", frozenset({"sqlite"}))
+    in_db = proverb_verify._daily_range_spread(db, STATION_ID)
+
+    for season in ("spring", "summer"):
+        assert in_db[season][0] == fallback[season][0]
+        assert in_db[season][1] == pytest.approx(fallback[season][1])
+
+
+def test_station_with_most_data_is_cached(db, monkeypatch):
+    """預設站點查詢結果在 TTL 內沿用"""
+    monkeypatch.setattr(proverb_verify, "_default_station", None)
+    _add_days(db, date(2000, 1, 1), date(2000, 1, 10), precipitation=0.0)
+    assert proverb_verify._get_station_with_most_data(db) == STATION_ID
+
+    for day in range(1, 21):
+        db.add(RawObservation(station_id="467410", observed_date=date(2000, 2, day)))
+    db.commit()
+    assert proverb_verify._get_station_with_most_data(db) == STATION_ID
+
+    monkeypatch.setattr(proverb_verify, "_DEFAULT_STATION_TTL", 0)
+    assert proverb_verify._get_station_with_most_data(db) == "467410"
+
+
+def test_verify_three_fu_days(db):
+    """七月高溫天數比例與其他月份對照"""
+    for year in (2000, 2001, 2002, 2003):
+        _add_days(db, date(year, 7, 1), date(year, 7, 31),
+                  temperature_max=lambda d: 36.0 if d.day <= 8 else 32.0)
+        _add_days(db, date(year, 1, 1), date(year, 1, 31), temperature_max=20.0)
+        # 六月、八月不列入對照組
+        _add_days(db, date(year, 6, 1), date(year, 6, 30), temperature_max=10.0)
+
+    result = verify_three_fu_days(db, STATION_ID)
+
+    assert result.verification.total_cases == 124
+    assert result.verification.positive_cases == 32
+    assert "確實是一年最熱時期" in result.verification.interpretation
+
+
+def test_verify_all_proverbs_parallel_keeps_order(tmp_path):
+    """檔案型資料庫以執行緒池並行驗證，結果仍依固定順序回傳"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'verify.db'}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    _add_days(db, date(2000, 1, 1), date(2001, 12, 31),
+              precipitation=1.0, temperature_max=30.0, temperature_min=20.0)
+
+    results = verify_all_proverbs(db, STATION_ID)
+    db.close()
+    engine.dispose()
+
+    assert [r.proverb_id for r in results] == list(VERIFICATION_FUNCTIONS)
+    assert all(r.confidence_level != "錯誤" for r in results)
+
+
+def test_verification_cached_until_data_changes(db):
+    """資料未變動時沿用快取，新增觀測後重新驗證"""
+    _add_days(db, date(2000, 2, 4), date(2000, 4, 5), precipitation=1.0)
+
+    first = verify_lichun_rain(db, STATION_ID)
+    assert verify_lichun_rain(db, STATION_ID) is first
+
+    _add_days(db, date(2001, 2, 4), date(2001, 4, 5), precipitation=1.0)
+    refreshed = verify_lichun_rain(db, STATION_ID)
+    assert refreshed is not first
+    assert refreshed.verification.total_cases == 2
+
+
+def test_three_fu_days_monthly_snapshot_matches_raw(db):
+    """每月統計快照與掃描原始觀測的驗證結果一致"""
+    for year in (2000, 2001, 2002, 2003):
+        _add_days(db, date(year, 7, 1), date(year, 7, 31),
+                  temperature_max=lambda d: 36.0 if d.day <= 8 else 32.0, temperature_min=25.0)
+        _add_days(db, date(year, 1, 1), date(year, 1, 31),
+                  temperature_max=20.0, temperature_min=lambda d: 8.0 if d.day <= 20 else 12.0)
+        _add_days(db, date(year, 4, 1), date(year, 4, 30),
+                  temperature_max=26.0, temperature_min=18.0)
+    raw = [verify_three_fu_days(db, STATION_ID), verify_cold_in_nine(db, STATION_ID)]
+
+    assert refresh_monthly_statistics(db, STATION_ID) == 3
+    clear_verification_cache()
+    snapshot = [verify_three_fu_days(db, STATION_ID), verify_cold_in_nine(db, STATION_ID)]
+
+    assert snapshot == raw
+
+
+def test_stats_summary_reads_stored_results(db, monkeypatch):
+    """驗證結果寫入快取表後，摘要直接彙總而不重新驗證"""
+    _add_days(db, date(2000, 1, 1), date(2001, 12, 31),
+              precipitation=1.0, temperature_max=30.0, temperature_min=20.0)
+
+    first = get_proverb_stats_summary(db, STATION_ID)
+    assert db.query(ProverbVerificationCache).count() == len(VERIFICATION_FUNCTIONS)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("不應重新驗證")
+
+    monkeypatch.setattr(proverb_verify, "verify_all_proverbs", fail)
+    assert get_proverb_stats_summary(db, STATION_ID) == first
+
+
+def test_default_station_resolved_once_per_session(db, monkeypatch):
+    """未指定站點時，同一 session 只查詢一次預設站點"""
+    calls = []
+
+    def fake_station(session):
+        calls.append(session)
+        return STATION_ID
+
+    monkeypatch.setattr(proverb_verify, "_get_station_with_most_data", fake_station)
+    proverb_verify.verify_proverb(db, "lichun_rain")
+    get_proverb_stats_summary(db)
+
+    assert len(calls) == 1
+
+
+def test_data_fingerprint_queried_once_per_verify_all(db):
+    """verify_all_proverbs 只查詢一次資料指紋，各驗證函數沿用"""
+    _add_days(db, date(2000, 1, 1), date(2000, 12, 31), precipitation=1.0)
+    statements = []
+    event.listen(
+        db.get_bind(), "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    verify_all_proverbs(db, STATION_ID)
+
+    assert sum("max(raw_observations.id)" in s for s in statements) == 1
+
+
+def test_monthly_snapshot_refresh_invalidates_cache(db):
+    """重算每月統計快照後，使用快照的驗證結果不沿用快取"""
+    for year in (2000, 2001):
+        _add_days(db, date(year, 7, 1), date(year, 7, 31), temperature_max=36.0)
+        _add_days(db, date(year, 1, 1), date(year, 1, 31), temperature_max=20.0)
+    refresh_monthly_statistics(db, STATION_ID)
+    first = verify_three_fu_days(db, STATION_ID)
+
+    db.query(MonthlyStatistics).update({"computed_at": datetime(2000, 1, 1)})
+    db.commit()
+
+    assert verify_three_fu_days(db, STATION_ID) is not first
+
+
+def test_stored_results_written_only_when_recomputed(tmp_path):
+    """結果皆來自程序內快取時不寫入快取表；資料變動後以 upsert 更新"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'verify.db'}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    _add_days(db, date(2000, 1, 1), date(2000, 12, 31), precipitation=1.0)
+    writes = []
+    event.listen(
+        engine, "before_cursor_execute",
+        lambda conn, cursor, statement, *args: writes.append(statement)
+        if statement.startswith("INSERT INTO proverb_verification_cache") else None,
+    )
+
+    verify_all_proverbs(db, STATION_ID)
+    verify_all_proverbs(db, STATION_ID)
+    assert len(writes) == 1
+
+    _add_days(db, date(2001, 1, 1), date(2001, 12, 31), precipitation=1.0)
+    verify_all_proverbs(db, STATION_ID)
+    assert len(writes) == 2
+    assert db.query(ProverbVerificationCache).count() == len(VERIFICATION_FUNCTIONS)
+
+    db.close()
+    engine.dispose()
+
+
+def test_station_years_skip_gap_years(db):
+    """缺資料的年份不列入分析年數"""
+    for year in (2000, 2003):
+        _add_days(db, date(year, 2, 1), date(year, 2, 10), precipitation=0.0)
+
+    assert proverb_verify._station_years(db, STATION_ID) == [2000, 2003]
+    assert verify_lichun_rain(db, STATION_ID).data_quality.startswith("分析了 2 年資料")
+
+
+def test_store_results_failure_still_returns_results(db, monkeypatch, caplog):
+    """快取表寫入失敗時記錄警告，仍回傳驗證結果"""
+    _add_days(db, date(2000, 1, 1), date(2000, 12, 31), precipitation=1.0)
+
+    def fail(*args, **kwargs):
+        raise OperationalError("INSERT", {}, Exception("database is locked"))
+
+    monkeypatch.setattr(proverb_verify, "_store_results", fail)
+    with caplog.at_level(logging.WARNING, logger=proverb_verify.__name__):
+        results = verify_all_proverbs(db, STATION_ID)
+
+    assert [r.proverb_id for r in results] == list(VERIFICATION_FUNCTIONS)
+    assert "寫入諺語驗證結果快取表失敗" in caplog.text
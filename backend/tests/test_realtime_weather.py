@@ -0,0 +1,183 @@
+"""即時天氣查詢服務測試"""
+
+import httpx
+import orjson
+import pytest
+
+from app.services import realtime_weather
+from app.services.realtime_weather import (
+    clear_realtime_cache,
+    fetch_all_realtime_weather,
+    fetch_multi_realtime_weather,
+    fetch_realtime_weather,
+)
+
+
+def _station(station_id: str, temp: float) -> dict:
+    """CWA O-A0003-001 單一站點資料"""
+    return {
+        "StationName": "臺北",
+        "StationId": station_id,
+        "ObsTime": {"DateTime": "2026-01-15T14:00:00+08:00"},
+        "WeatherElement": {
+            "Weather": "晴",
+            "Now": {"Precipitation": 0.5},
+            "WindSpeed": 2.3,
+            "AirTemperature": temp,
+            "RelativeHumidity": 65,
+            "SunshineDuration": -99,
+            "DailyExtreme": {
+                "DailyHigh": {"TemperatureInfo": {"AirTemperature": 24.1}},
+                "DailyLow": {"TemperatureInfo": {"AirTemperature": "-99"}},
+            },
+        },
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    clear_realtime_cache()
+    yield
+    clear_realtime_cache()
+
+
+@pytest.fixture
+def cwa_requests(monkeypatch):
+    """以 MockTransport 取代共用 client，回傳收到的請求列表"""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        station_id = request.url.params.get("StationId")
+        if station_id == "500000":
+            return httpx.Response(500)
+        if station_id == "000000":
+            stations = []
+        elif station_id:
+            stations = [_station(station_id, 21.5)]
+        else:
+            stations = [_station("466920", 21.5), _station("467410", 25.0)]
+        return httpx.Response(200, content=orjson.dumps({"records": {"Station": stations}}))
+
+    client = httpx.AsyncClient(
+        base_url="https://cwa.test/datastore", transport=httpx.MockTransport(handler)
+    )
+    monkeypatch.setattr(realtime_weather, "_client", client)
+    yield requests
+
+
+async def test_fetch_realtime_weather(cwa_requests):
+    """解析單一站點觀測，-99 視為缺值"""
+    data = await fetch_realtime_weather("466920")
+
+    assert cwa_requests[0].url.path == "/datastore/O-A0003-001"
+    assert "AirTemperature" in cwa_requests[0].url.params["WeatherElement"]
+    assert data.station_id == "466920"
+    assert data.obs_time.isoformat() == "2026-01-15T14:00:00+08:00"
+    assert data.temp == 21.5
+    assert data.temp_max == 24.1
+    assert data.temp_min is None
+    assert data.humidity == 65
+    assert data.precipitation == 0.5
+    assert data.sunshine_hours is None
+
+
+async def test_fetch_all_reuses_shared_client(cwa_requests):
+    """多次查詢共用同一個 client"""
+    await fetch_realtime_weather("466920")
+    results = await fetch_all_realtime_weather()
+
+    assert [r.station_id for r in results] == ["466920", "467410"]
+    assert len(cwa_requests) == 2
+    assert await realtime_weather.get_client() is realtime_weather._client
+
+
+async def test_realtime_results_cached_until_ttl(cwa_requests, monkeypatch):
+    """有效期內沿用快取；單站查詢可直接取自全站點結果"""
+    results = await fetch_all_realtime_weather()
+    assert await fetch_all_realtime_weather() == results
+    assert (await fetch_realtime_weather("467410")).temp == 25.0
+    assert len(cwa_requests) == 1
+
+    monkeypatch.setattr(realtime_weather, "_REALTIME_CACHE_TTL", 0)
+    await fetch_all_realtime_weather()
+    assert len(cwa_requests) == 2
+
+
+def test_parse_station_accepts_element_list():
+    """舊版列表格式的 WeatherElement 轉成 dict 後解析結果相同"""
+    station = _station("466920", 21.5)
+    station["WeatherElement"] = [
+        {"ElementName": name, "ElementValue": value}
+        for name, value in station["WeatherElement"].items()
+    ]
+
+    data = realtime_weather._parse_station(station)
+
+    assert data.weather == "晴"
+    assert data.temp == 21.5
+    assert data.temp_max == 24.1
+    assert data.precipitation == 0.5
+
+
+@pytest.mark.parametrize("value, expected", [
+    (21.5, 21.5), ("21.5", 21.5), (0, 0.0), ("0.0", 0.0),
+    (-99, None), (-99.0, None), ("-99", None), ("-99.0", None), ("", None),
+    (None, None), ("X", None),
+])
+def test_parse_weather_element_values(value, expected):
+    """-99、空字串與無法轉換的值視為缺值，0 為有效值"""
+    elements = {
+        "AirTemperature": value,
+        "DailyExtreme": {"DailyLow": {"TemperatureInfo": {"AirTemperature": value}}},
+    }
+
+    assert realtime_weather.parse_weather_element(elements, "AirTemperature") == expected
+    assert realtime_weather.parse_daily_extreme(elements, "DailyLow") == expected
+
+
+async def test_mutating_cached_results_does_not_affect_cache(cwa_requests):
+    """呼叫端修改回傳的 list 不影響下一次取得的快取結果"""
+    results = await fetch_all_realtime_weather()
+    results.clear()
+
+    cached = await fetch_all_realtime_weather()
+    cached.reverse()
+
+    assert [r.station_id for r in await fetch_all_realtime_weather()] == ["466920", "467410"]
+    assert len(cwa_requests) == 1
+
+
+async def test_fetch_multi_realtime_weather(cwa_requests):
+    """多站點同時查詢，依輸入順序回傳並略過查無資料的站點"""
+    results = await fetch_multi_realtime_weather(["467410", "000000", "466920"])
+
+    assert [r.station_id for r in results] == ["467410", "466920"]
+    assert len(cwa_requests) == 3
+
+
+async def test_http_error_is_logged(cwa_requests, caplog):
+    """CWA 回傳 HTTP 錯誤時記錄警告並回傳 None"""
+    with caplog.at_level("WARNING", logger="app.services.realtime_weather"):
+        assert await fetch_realtime_weather("500000") is None
+
+    assert "CWA API HTTP 錯誤: 500" in caplog.text
+
+
+def test_parse_daily_extreme_missing_levels():
+    """DailyExtreme 任一層缺少或格式不符時返回 None"""
+    assert realtime_weather.parse_daily_extreme({}, "DailyHigh") is None
+    assert realtime_weather.parse_daily_extreme({"DailyExtreme": None}, "DailyHigh") is None
+    assert realtime_weather.parse_daily_extreme(
+        {"DailyExtreme": {"DailyHigh": "-99"}}, "DailyHigh"
+    ) is None
+
+
+async def test_fetch_all_realtime_weather_df(cwa_requests):
+    """全站點資料轉為欄位式 DataFrame，缺值為 NaN"""
+    df = await realtime_weather.fetch_all_realtime_weather_df()
+
+    assert list(df["station_id"]) == ["466920", "467410"]
+    assert df["temp"].max() == 25.0
+    assert df["temp_min"].isna().all()
+    assert df["temp"].dtype == "float64"
@@ -0,0 +1,97 @@
+"""二十四節氣服務測試"""
+
+import dataclasses
+from datetime import date, datetime, timedelta
+
+import cnlunar
+import pytest
+
+from app.services.solar_term import (
+    SOLAR_TERMS_DATA,
+    _terms_around,
+    get_all_solar_terms,
+    get_current_solar_term,
+    get_current_solar_term_async,
+    get_nearest_solar_term,
+    get_nearest_solar_term_async,
+    get_solar_term_info,
+    get_solar_terms_by_season,
+)
+
+
+def test_get_all_solar_terms_sorted_by_order():
+    """依序號排序回傳 24 個節氣"""
+    terms = get_all_solar_terms()
+
+    assert [t.order for t in terms] == list(range(1, 25))
+    assert terms[0].name == "立春"
+
+
+def test_get_solar_terms_by_season():
+    """季節分組與逐筆篩選結果一致"""
+    for season in ("春", "夏", "秋", "冬"):
+        assert list(get_solar_terms_by_season(season)) == [
+            t for t in SOLAR_TERMS_DATA.values() if t.season == season
+        ]
+    assert get_solar_terms_by_season("不存在") == ()
+
+
+def test_get_nearest_solar_term_matches_daily_scan():
+    """節氣表查詢與逐日以 cnlunar 判斷的結果一致（含跨年）"""
+    start, end = date(2025, 11, 15), date(2027, 1, 31)
+    days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+    term_days = [
+        (d, name) for d in days
+        if (name := cnlunar.Lunar(datetime(d.year, d.month, d.day, 12)).todaySolarTerms) != "无"
+    ]
+
+    for d in days:
+        if d < term_days[0][0] or d >= term_days[-1][0]:
+            continue
+        current = [t for t in term_days if t[0] <= d][-1]
+        upcoming = next(t for t in term_days if t[0] > d)
+
+        result = get_nearest_solar_term(d)
+
+        assert result["current"] == get_solar_term_info(current[1])
+        assert result["next"] == get_solar_term_info(upcoming[1])
+        assert result["days_to_next"] == (upcoming[0] - d).days
+
+
+def test_solar_term_lookups_are_cached():
+    """同一天重複查詢沿用快取，回傳的 dict 各自獨立"""
+    get_current_solar_term.cache_clear()
+    day = date(2026, 2, 4)
+
+    assert get_current_solar_term(day) == "立春"
+    assert get_current_solar_term(day) == "立春"
+    assert get_current_solar_term.cache_info().hits == 1
+
+    first = get_nearest_solar_term(day)
+    first["days_to_next"] = None
+    assert get_nearest_solar_term(day)["days_to_next"] == 14
+
+
+def test_solar_term_info_is_immutable():
+    """節氣資料為不可變，列表欄位為 tuple"""
+    info = get_solar_term_info("立春")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        info.name = "改寫"
+    assert isinstance(info.phenology, tuple)
+    assert isinstance(info.proverbs, tuple)
+
+
+async def test_async_variants_match_sync():
+    """非同步版本與同步版本結果一致"""
+    day = date(2026, 2, 4)
+
+    assert await get_current_solar_term_async(day) == get_current_solar_term(day)
+    assert await get_nearest_solar_term_async(day) == get_nearest_solar_term(day)
+
+
+def test_consecutive_terms_at_most_16_days_apart():
+    """相鄰節氣間隔不超過 16 天，往前 16 天內必可找到當前節氣"""
+    for year in range(1901, 2100):
+        dates, _ = _terms_around(year)
+        assert max((b - a).days for a, b in zip(dates, dates[1:])) <= 16
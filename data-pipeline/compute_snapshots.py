@@ -22,8 +22,10 @@ from sqlalchemy.orm import Session
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "backend"))
 
-from app.models import Base, RawObservation, DailyStatistics
+from app.database import init_db
+from app.models import RawObservation, DailyStatistics
 from app.analytics.engine import HistoricalWeatherAnalyzer
+from app.services.monthly_stats import refresh_monthly_statistics
 
 
 def load_observation_data(db_path: Path, station_id: str) -> pd.DataFrame:
@@ -38,6 +40,9 @@ def load_observation_data(db_path: Path, station_id: str) -> pd.DataFrame:
     """
     engine = create_engine(f"sqlite:///{db_path}", echo=False)
 
+    # 舊資料庫需先補上產生欄位，ORM 查詢才能對應目前的資料表結構
+    init_db(engine)
+
     with Session(engine) as session:
         # 查詢該站點的所有觀測資料
         observations = session.query(RawObservation).filter(
@@ -107,8 +112,8 @@ def compute_and_save_statistics(
     """
     engine = create_engine(f"sqlite:///{db_path}", echo=False)
 
-    # 確保資料表存在
-    Base.metadata.create_all(engine)
+    # 確保資料表存在，並為舊資料庫補上每月統計快照所需的產生欄位
+    init_db(engine)
 
     # 生成 366 天
     all_days = generate_366_days()
@@ -195,6 +200,10 @@ def compute_and_save_statistics(
 
         print(f"  已插入 {len(statistics_records):,} 筆新統計資料")
 
+        # 同步重算每月統計快照，讓諺語驗證讀到與觀測資料一致的數據
+        monthly_count = refresh_monthly_statistics(session, station_id)
+        print(f"  已更新 {monthly_count} 筆每月統計快照")
+
     return len(statistics_records)
 
 
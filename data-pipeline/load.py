@@ -20,7 +20,8 @@ from sqlalchemy.orm import Session
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "backend"))
 
-from app.models import Base, RawObservation
+from app.database import init_db
+from app.models import RawObservation
 
 
 def load_and_aggregate_csv(csv_path: Path, station_id: str) -> pd.DataFrame:
@@ -95,9 +96,9 @@ def load_to_database(df: pd.DataFrame, db_path: Path) -> int:
     # 建立資料庫引擎
     engine = create_engine(f"sqlite:///{db_path}", echo=False)
 
-    # 建立所有資料表
+    # 建立所有資料表（既有資料庫會補上新增的產生欄位）
     print(f"正在建立資料庫: {db_path}")
-    Base.metadata.create_all(engine)
+    init_db(engine)
 
     # 載入資料
     print("正在載入資料到資料庫...")
@@ -0,0 +1,57 @@
+"""統計快照計算測試"""
+
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine, text
+
+
+def _create_legacy_database(db_path):
+    """建立沒有 observed_year/month/day 產生欄位的舊版資料庫"""
+    engine = create_engine(f"sqlite:///{db_path}")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE raw_observations ("
+            "id INTEGER PRIMARY KEY, station_id VARCHAR(10) NOT NULL, "
+            "observed_date DATE NOT NULL, temperature_avg FLOAT, temperature_max FLOAT, "
+            "temperature_min FLOAT, precipitation FLOAT, humidity_avg FLOAT, "
+            "wind_speed_avg FLOAT, wind_speed_max FLOAT, sunshine_hours FLOAT, "
+            "global_radiation_sum FLOAT, station_pressure_avg FLOAT)"
+        ))
+        day = date(2000, 1, 1)
+        while day <= date(2001, 12, 31):
+            conn.execute(text(
+                "INSERT INTO raw_observations (station_id, observed_date, temperature_avg, "
+                "temperature_max, temperature_min, precipitation) "
+                "VALUES ('466920', :d, 22.0, 27.0, 18.0, 0.0)"
+            ), {"d": day})
+            day += timedelta(days=1)
+    engine.dispose()
+
+
+def test_compute_snapshots_on_legacy_database(tmp_path):
+    """舊版資料庫也能計算每日統計並重算每月統計快照"""
+    from compute_snapshots import (
+        HistoricalWeatherAnalyzer,
+        compute_and_save_statistics,
+        load_observation_data,
+    )
+
+    db_path = tmp_path / "legacy.db"
+    _create_legacy_database(db_path)
+
+    df = load_observation_data(db_path, "466920")
+    saved = compute_and_save_statistics(
+        db_path, "466920", HistoricalWeatherAnalyzer(df), 2000, 2001
+    )
+
+    assert saved == 366
+    engine = create_engine(f"sqlite:///{db_path}")
+    with engine.connect() as conn:
+        rows = conn.execute(text(
+            "SELECT month, temp_max_count, temp_max_mean FROM monthly_statistics "
+            "WHERE station_id = '466920' ORDER BY month"
+        )).all()
+    engine.dispose()
+    assert [row.month for row in rows] == list(range(1, 13))
+    assert rows[0].temp_max_count == 62
+    assert rows[0].temp_max_mean == 27.0